@@ -6,9 +6,11 @@ Supports both Ollama (local) and OpenAI (cloud) providers.
 import os
 import json
 import logging
+from functools import cached_property
 from typing import List, Dict, Optional
 from ..parsers.models import TestResult
 from ..settings import Config
+from ..utils import TestNameNormalizer
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,11 @@ class FailureClassification:
         self.recommended_action = recommended_action
         self.root_cause_category = root_cause_category  # ELEMENT_NOT_FOUND, TIMEOUT, etc.
     
+    @cached_property
+    def normalized_name(self) -> str:
+        """Test name as normalized by TestNameNormalizer, computed on first access"""
+        return TestNameNormalizer.normalize(self.test_name)
+    
     def is_product_bug(self) -> bool:
         """Check if classified as product bug"""
         return self.classification == "PRODUCT_BUG"
@@ -362,7 +362,6 @@ class AgentMemory:
                         logger.debug(f"No match found for DB test name: '{db_test_name}' (query names: {list(query_names_map.keys())[:5]})")
                 
                 # Process results: limit per test and build execution records
-                import re
                 for test_name, rows in results_by_test.items():
                     # Limit to last N executions per test (already ordered by id DESC or date DESC)
                     limited_rows = rows[:limit_per_test]
@@ -428,7 +427,6 @@ class AgentMemory:
                 logger.error(f"Error executing batch query: {e}")
                 # Fallback to individual queries if batch query fails
                 logger.warning("Falling back to individual queries")
-                import re
                 for test_name in test_names:
                     query_name = extract_class_method(test_name)
                     try:
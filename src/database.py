@@ -21,6 +21,9 @@ from .settings import Config
 
 logger = logging.getLogger(__name__)
 
+# Report name -> table name: "Regression-<Project>..." or "ProdSanity-..." in a single scan
+_REPORT_TABLE_PATTERN = re.compile(r'Regression-(?P<project>[A-Za-z]+)(?P<dash>-)?|(?P<prodsanity>ProdSanity-)')
+
 if not MYSQL_AVAILABLE:
     logger.warning("pymysql not installed. MySQL features will be disabled.")
 
@@ -70,22 +73,23 @@ class Database:
         if not report_name:
             return None
         
-        # Pattern 1: "Regression-AccountOpening-Tests-420" -> "results_accountopening"
-        match = re.search(r'Regression-([A-Za-z]+)-', report_name)
-        if match:
-            project_name = match.group(1).lower()
-            return f"results_{project_name}"
-        
-        # Pattern 2: "ProdSanity-All-Tests-524" -> "results_prodsanity"
-        match = re.search(r'ProdSanity-', report_name)
-        if match:
+        # "Regression-AccountOpening-Tests-420" -> "results_accountopening"
+        # "ProdSanity-All-Tests-524" -> "results_prodsanity"
+        # Checked in this order, wherever each occurs: "Regression-<Project>-", "ProdSanity-",
+        # then "Regression-<Project>" without the trailing dash
+        prodsanity = False
+        fallback_project = None
+        for match in _REPORT_TABLE_PATTERN.finditer(report_name):
+            if match.group('prodsanity'):
+                prodsanity = True
+            elif match.group('dash'):
+                return f"results_{match.group('project').lower()}"
+            elif fallback_project is None:
+                fallback_project = match.group('project')
+        if prodsanity:
             return "results_prodsanity"
-        
-        # Fallback: try to extract any word after "Regression-"
-        match = re.search(r'Regression-([A-Za-z]+)', report_name)
-        if match:
-            project_name = match.group(1).lower()
-            return f"results_{project_name}"
+        if fallback_project:
+            return f"results_{fallback_project.lower()}"
         
         logger.warning(f"Could not extract table name from report_name: {report_name}")
         return None
@@ -8,6 +8,7 @@ import sys
 import logging
 import argparse
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Suppress ALL warnings from urllib3 BEFORE importing anything
@@ -26,8 +27,7 @@ from src.settings import Config
 from src.parsers.data_builder import (
     find_latest_report,
     get_full_report_data_from_db,
-    get_execution_logs_from_html,
-    get_test_durations_from_html
+    get_html_metadata
 )
 from src.agent.analyzer import TestAnalyzer
 from src.agent.summary_generator import SummaryGenerator
@@ -112,6 +112,14 @@ def main():
         traceback.print_exc()
         return
     
+    # Start HTML parsing in the background - it only needs the report directory, so it
+    # overlaps with the flaky and trend queries below instead of running after them.
+    # Started only once results exist, so the early returns above never wait on it at exit
+    logger.info("📄 Extracting execution logs from HTML in the background...")
+    html_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="html-metadata")
+    html_metadata_future = html_executor.submit(get_html_metadata, report_dir)
+    html_executor.shutdown(wait=False)
+    
     # 3. Calculate Flaky Tests (using database)
     logger.info("🔍 Calculating flaky tests from database...")
     all_test_names_from_db = [row.get('testcaseName', '') for row in db_results if row.get('testcaseName')]
@@ -146,17 +154,15 @@ def main():
     logger.info(f"📈 Trend: {trend_value} (Avg Pass Rate: {avg_pass_rate:.1f}%)")
     
     # 4. Parse HTML for Execution Logs Only
-    logger.info("📄 Extracting execution logs from HTML...")
-    execution_logs, html_links = get_execution_logs_from_html(report_dir)
-    durations = get_test_durations_from_html(report_dir)
+    execution_logs, html_links, durations = html_metadata_future.result()
     logger.info(f"📝 Extracted execution logs for {len(execution_logs)} tests")
     
     # 5. Merge DB Data + HTML Logs
     logger.info("🔄 Merging database results with HTML execution logs...")
     try:
         data = get_full_report_data_from_db(report_dir, db_results, execution_logs, durations, html_links)
-        summary = data['summary']
-        failures = [r for r in data['test_results'] if r.is_failure]
+        summary = data.summary
+        failures = [r for r in data.test_results if r.is_failure]
         
         logger.info(f"📊 Total tests: {summary.total}. Pass Rate: {summary.pass_rate:.1f}%")
         logger.info(f"❌ Found {len(failures)} failures")
@@ -201,10 +207,10 @@ def main():
         logger.info("🎉 No failures to analyze!")
 
     # Filter recurring failures to only show those that match current test structure
-    if recurring and data.get('test_results'):
-        all_current_test_names = {t.full_name for t in data['test_results']}
+    if recurring and data.test_results:
+        all_current_test_names = {t.full_name for t in data.test_results}
         current_test_patterns = set()
-        for t in data['test_results']:
+        for t in data.test_results:
             parts = t.full_name.split('.')
             if len(parts) >= 2:
                 current_test_patterns.add('.'.join(parts[-2:]))  # ClassName.methodName
@@ -230,7 +236,7 @@ def main():
     report_gen = ReportGenerator()
     # Create cache for consistent data access
     from src.utils import TestDataCache
-    test_data_cache = TestDataCache(data['test_results'], data.get('html_links', {}))
+    test_data_cache = TestDataCache(data.test_results, data.html_links)
     test_api_map = report_gen.extract_test_api_map(classifications, test_data_cache)
     logger.info(f"📊 Found API endpoints for {len(test_api_map)} tests")
     
@@ -249,8 +255,8 @@ def main():
             seen_tests[test_name_normalized] = classification
             deduplicated_classifications.append(classification)
     
-    for failure in deduplicated_classifications:
-        category = rule_engine.classify(failure, test_data_cache)
+    categories = rule_engine.classify_all(deduplicated_classifications, test_data_cache)
+    for failure, category in zip(deduplicated_classifications, categories):
         if category not in category_counts:
             category_counts[category] = 0
             category_failures[category] = []
@@ -269,13 +275,18 @@ def main():
         category_counts=category_counts,
         category_failures=category_failures,
         recurring_failures=recurring,
-        test_html_links=data.get('html_links', {}),
-        test_results=data.get('test_results')
+        test_html_links=data.html_links,
+        test_results=data.test_results
     )
 
     # 7. Generate HTML Report
     logger.info("🎨 Generating HTML Report...")
-    html_content, _ = report_gen.generate_html_report(
+    # Save HTML report with dynamic name based on report_name
+    # Sanitize report_name for filename (remove invalid characters)
+    safe_report_name = "".join(c for c in report_name if c.isalnum() or c in ('-', '_', ' ')).strip().replace(' ', '-')
+    html_report_path = Path(output_dir) / f"AI-Generated-Report_{safe_report_name}.html"
+    saved_path, _ = report_gen.save_html_report(
+        str(html_report_path),
         summary=summary,
         classifications=classifications,
         report_name=report_name,
@@ -283,15 +294,9 @@ def main():
         recurring_failures=recurring,
         trend=trends['trend'],
         report_dir=report_dir,
-        test_results=data['test_results'],
-        test_html_links=data.get('html_links', {})
+        test_results=data.test_results,
+        test_html_links=data.html_links
     )
-    
-    # Save HTML report with dynamic name based on report_name
-    # Sanitize report_name for filename (remove invalid characters)
-    safe_report_name = "".join(c for c in report_name if c.isalnum() or c in ('-', '_', ' ')).strip().replace(' ', '-')
-    html_report_path = Path(output_dir) / f"AI-Generated-Report_{safe_report_name}.html"
-    saved_path = report_gen.save_report(html_content, str(html_report_path))
     logger.info(f"📄 HTML report saved to: {saved_path}")
 
 
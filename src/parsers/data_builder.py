@@ -3,18 +3,49 @@ Data builder - combines database results with HTML execution logs.
 Database-first approach: Get test results from DB, enhance with HTML execution logs.
 """
 
+import os
+import fnmatch
 from pathlib import Path
 from typing import List, Optional, Dict
 import logging
 import re
 
 from .html_parser import HTMLReportParser
-from .models import TestResult, TestStatus, TestSummary
+from .models import FAILURE_STATUSES, ReportBundle, TestResult, TestStatus, TestSummary
 from ..utils import remove_duplicate_class_name
 
 logger = logging.getLogger(__name__)
 
+_ERROR_TYPE_PATTERN = re.compile(r'(\w+Exception|\w+Error)')
 
+# Database testStatus (upper-cased) -> TestStatus
+_STATUS_MAP = {
+    status_str: status
+    for status_strs, status in (
+        (('PASS', 'PASSED', 'SUCCESS', 'OK'), TestStatus.PASS),
+        (('FAIL', 'FAILED', 'FAILURE'), TestStatus.FAIL),
+        (('ERROR', 'ERRORED'), TestStatus.ERROR),
+        (('SKIP', 'SKIPPED'), TestStatus.SKIP),
+    )
+    for status_str in status_strs
+}
+
+
+def _is_metadata_line(line: str) -> bool:
+    """
+    Check if a failureReason line is pipeline metadata ("Results Url:" / "Testcase Name:").
+    Leading whitespace, whitespace between the words and before the colon, and case are ignored.
+    Uses plain string operations instead of a regex since it runs on every line of every stack trace.
+    """
+    stripped = line.lstrip()
+    head = stripped[:8].lower()
+    if head.startswith('results'):
+        rest, keyword = stripped[7:].lstrip(), 'url'
+    elif head == 'testcase':
+        rest, keyword = stripped[8:].lstrip(), 'name'
+    else:
+        return False
+    return rest[:len(keyword)].lower() == keyword and rest[len(keyword):].lstrip().startswith(':')
 
 
 def find_latest_report(reports_dir: str, pattern: str = "Regression-*") -> Optional[str]:
@@ -28,24 +59,30 @@ def find_latest_report(reports_dir: str, pattern: str = "Regression-*") -> Optio
     Returns:
         Path to latest report directory, or None if not found
     """
-    reports_path = Path(reports_dir)
-    
-    if not reports_path.exists():
+    # Single directory scan; DirEntry caches the type and stat info
+    try:
+        with os.scandir(reports_dir) as entries:
+            report_dirs = [
+                (entry.name, entry.stat().st_mtime)
+                for entry in entries
+                if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_dir()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         logger.error(f"Reports directory not found: {reports_dir}")
         return None
-    
-    # Find all matching directories
-    report_dirs = [d for d in reports_path.glob(pattern) if d.is_dir()]
+    except PermissionError as e:
+        logger.error(f"Cannot read reports directory {reports_dir}: {e}")
+        return None
     
     if not report_dirs:
         logger.warning(f"No report directories found matching pattern: {pattern}")
         return None
     
-    # Sort by modification time (most recent first)
-    latest = max(report_dirs, key=lambda d: d.stat().st_mtime)
+    # Pick the most recently modified directory
+    latest_name = max(report_dirs, key=lambda d: d[1])[0]
     
-    logger.info(f"Latest report: {latest.name}")
-    return str(latest)
+    logger.info(f"Latest report: {latest_name}")
+    return str(Path(reports_dir) / latest_name)
 
 
 def db_row_to_test_result(db_row: Dict, execution_log: Optional[str] = None, duration: Optional[float] = None) -> TestResult:
@@ -66,29 +103,19 @@ def db_row_to_test_result(db_row: Dict, execution_log: Optional[str] = None, dur
     
     # Extract class name and method name from testcaseName
     # Format: "ClassName.methodName" or "package.ClassName.methodName"
-    parts = testcase_name.split('.')
-    if len(parts) >= 2:
-        class_name = '.'.join(parts[:-1])  # Everything except last part
-        method_name = parts[-1]  # Last part is method
-    else:
+    class_name, sep, method_name = testcase_name.rpartition('.')
+    if not sep:
         # Fallback: use testcaseName as method, empty class
         class_name = ''
         method_name = testcase_name
     
     # Parse status
     status_str = db_row.get('testStatus', '').upper().strip()
-    if status_str in ['PASS', 'PASSED', 'SUCCESS', 'OK']:
-        status = TestStatus.PASS
-    elif status_str in ['FAIL', 'FAILED', 'FAILURE']:
-        status = TestStatus.FAIL
-    elif status_str in ['ERROR', 'ERRORED']:
-        status = TestStatus.ERROR
-    elif status_str in ['SKIP', 'SKIPPED']:
-        status = TestStatus.SKIP
-    else:
+    status = _STATUS_MAP.get(status_str)
+    if status is None:
         # Default to PASS if unknown
         status = TestStatus.PASS
-        logger.warning(f"Unknown status '{status_str}' for test {testcase_name}, defaulting to PASS")
+        logger.warning("Unknown status '%s' for test %s, defaulting to PASS", status_str, testcase_name)
     
     # Extract error information
     failure_reason = db_row.get('failureReason', '')
@@ -98,22 +125,23 @@ def db_row_to_test_result(db_row: Dict, execution_log: Optional[str] = None, dur
     
     if failure_reason:
         # Clean failure reason (remove "Results Url:" and "Testcase Name:" lines)
-        lines = failure_reason.split('\n')
-        cleaned_lines = []
-        for line in lines:
-            if re.match(r'^\s*Results\s*Url\s*:', line, re.IGNORECASE):
-                continue
-            if re.match(r'^\s*Testcase\s*Name\s*:', line, re.IGNORECASE):
-                continue
-            cleaned_lines.append(line)
-        failure_reason = '\n'.join(cleaned_lines).strip()
+        if '\n' in failure_reason:
+            lines = failure_reason.split('\n')
+            cleaned_lines = [line for line in lines if not _is_metadata_line(line)]
+            failure_reason = '\n'.join(cleaned_lines).strip()
+        elif _is_metadata_line(failure_reason):
+            # One-liner that is only pipeline metadata - nothing left to report
+            failure_reason = ''
+        else:
+            failure_reason = failure_reason.strip()
         
         if failure_reason:
-            # Try to extract error type from first line
-            first_line = failure_reason.split('\n')[0]
-            error_match = re.search(r'(\w+Exception|\w+Error)', first_line)
-            if error_match:
-                error_type = error_match.group(1)
+            # Try to extract error type from first line (cheap substring check before the regex)
+            first_line = failure_reason.partition('\n')[0]
+            if 'Exception' in first_line or 'Error' in first_line:
+                error_match = _ERROR_TYPE_PATTERN.search(first_line)
+                if error_match:
+                    error_type = error_match.group(1)
             
             # If it looks like a stack trace (has multiple lines and "at" patterns), use as stack_trace
             if '\n' in failure_reason and len(failure_reason) > 500:
@@ -149,35 +177,41 @@ def db_row_to_test_result(db_row: Dict, execution_log: Optional[str] = None, dur
     )
 
 
-def get_execution_logs_from_html(report_dir: str) -> tuple[Dict[str, str], Dict[str, str]]:
+def get_html_metadata(report_dir: str) -> tuple[Dict[str, str], Dict[str, str], Dict[str, float]]:
     """
-    Extract execution logs from HTML files, indexed by test full_name.
-    Also builds a mapping of test names to their HTML result file URLs.
+    Extract execution logs, HTML result file URLs and durations from HTML files in one pass.
+    overview.html and every suite results file are parsed exactly once.
     
     Args:
         report_dir: Path to report directory containing html/ subdirectory
         
     Returns:
-        Tuple of (execution_logs_dict, html_links_dict)
+        Tuple of (execution_logs_dict, html_links_dict, durations_dict)
         - execution_logs_dict: Dictionary mapping test full_name to execution_log string
         - html_links_dict: Dictionary mapping test full_name to HTML file URL
+        - durations_dict: Dictionary mapping test full_name to duration in seconds
     """
     report_path = Path(report_dir)
     html_dir = report_path / 'html'
     
-    if not html_dir.exists():
+    # List html/ once instead of stat()-ing overview.html and every suite results file
+    try:
+        with os.scandir(html_dir) as entries:
+            html_files = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
         logger.warning(f"No html/ directory found in {report_dir}, skipping execution log extraction")
-        return {}, {}
+        return {}, {}, {}
     
     html_parser = HTMLReportParser()
     execution_logs = {}
     html_links = {}
+    durations = {}
     
     # Parse overview.html to get list of test suites
     overview_path = html_dir / 'overview.html'
-    if not overview_path.exists():
+    if 'overview.html' not in html_files:
         logger.warning(f"overview.html not found in {html_dir}, skipping execution log extraction")
-        return {}, {}
+        return {}, {}, {}
     
     try:
         test_suites = html_parser.parse_overview(str(overview_path))
@@ -201,166 +235,143 @@ def get_execution_logs_from_html(report_dir: str) -> tuple[Dict[str, str], Dict[
                 project_name, 
                 job_name
             )
-        except:
+        except Exception as e:
             # Fallback to relative path
+            logger.debug("Could not build dashboard URL for HTML links, using relative path: %s", e)
             html_base_url = "html/"
         
-        # Parse each test suite's results file to extract execution logs and build links
-        for suite in test_suites:
-            results_file = html_dir / suite['results_file']
-            if results_file.exists():
-                try:
-                    suite_results = html_parser.parse_test_results(str(results_file))
-                    for result in suite_results:
-                        # Store execution log
-                        if result.execution_log:
-                            execution_logs[result.full_name] = result.execution_log
-                        
-                        # Build HTML link for this test
-                        # The link is to the suite's results file
-                        html_link = f"{html_base_url}{suite['results_file']}"
-                        html_links[result.full_name] = html_link
-                        
-                except Exception as e:
-                    logger.error(f"Failed to parse {suite['name']} for execution logs: {e}")
+        # Parse each test suite's results file once to extract execution logs, links and durations.
+        # parse_all spreads large reports across worker processes; results are consumed in suite
+        # order so later suites still win on duplicate names.
+        suites_to_parse = [
+            suite for suite in test_suites
+            if suite['results_file'] in html_files
+            # Links into subdirectories are not in the listing - check those individually
+            or ('/' in suite['results_file'] and (html_dir / suite['results_file']).is_file())
+        ]
+        if suites_to_parse:
+            results_files = [str(html_dir / suite['results_file']) for suite in suites_to_parse]
+            parsed_suites = html_parser.parse_all(results_files)
+            
+            for suite, results_file in zip(suites_to_parse, results_files):
+                # The link is to the suite's results file - identical for every test in the suite
+                html_link = html_base_url + suite['results_file']
+                for full_name, execution_log, duration_seconds in parsed_suites[results_file]:
+                    # Store execution log
+                    if execution_log:
+                        execution_logs[full_name] = execution_log
+                    
+                    # Build HTML link for this test
+                    html_links[full_name] = html_link
+                    
+                    if duration_seconds > 0:
+                        durations[full_name] = duration_seconds
         
         logger.info(f"Extracted execution logs for {len(execution_logs)} tests from HTML")
         logger.info(f"Built HTML links for {len(html_links)} tests")
-        return execution_logs, html_links
+        return execution_logs, html_links, durations
         
     except Exception as e:
         logger.error(f"Failed to extract execution logs from HTML: {e}")
-        return {}, {}
+        return {}, {}, {}
 
 
-def get_test_durations_from_html(report_dir: str) -> Dict[str, float]:
+def get_execution_logs_from_html(report_dir: str) -> tuple[Dict[str, str], Dict[str, str]]:
     """
-    Extract test durations from HTML files, indexed by test full_name.
+    Extract execution logs from HTML files, indexed by test full_name.
+    Also builds a mapping of test names to their HTML result file URLs.
+    Prefer get_html_metadata() when durations are needed as well.
     
     Args:
         report_dir: Path to report directory containing html/ subdirectory
         
     Returns:
-        Dictionary mapping test full_name to duration in seconds
+        Tuple of (execution_logs_dict, html_links_dict)
     """
-    report_path = Path(report_dir)
-    html_dir = report_path / 'html'
-    
-    if not html_dir.exists():
-        return {}
-    
-    html_parser = HTMLReportParser()
-    durations = {}
-    
-    overview_path = html_dir / 'overview.html'
-    if not overview_path.exists():
-        return {}
-    
-    try:
-        test_suites = html_parser.parse_overview(str(overview_path))
-        
-        for suite in test_suites:
-            results_file = html_dir / suite['results_file']
-            if results_file.exists():
-                try:
-                    suite_results = html_parser.parse_test_results(str(results_file))
-                    for result in suite_results:
-                        if result.duration_seconds > 0:
-                            durations[result.full_name] = result.duration_seconds
-                except Exception as e:
-                    logger.debug(f"Failed to parse {suite['name']} for durations: {e}")
-        
-        return durations
-        
-    except Exception as e:
-        logger.debug(f"Failed to extract durations from HTML: {e}")
-        return {}
+    execution_logs, html_links, _ = get_html_metadata(report_dir)
+    return execution_logs, html_links
 
 
-def _find_matching_execution_log(testcase_name: str, execution_logs: Dict[str, str]) -> Optional[str]:
+def get_test_durations_from_html(report_dir: str) -> Dict[str, float]:
     """
-    Find matching execution log for a testcase name using multiple matching strategies.
+    Extract test durations from HTML files, indexed by test full_name.
+    Prefer get_html_metadata() when execution logs are needed as well.
     
     Args:
-        testcase_name: Test case name from database (e.g., "ClassName.methodName" or "package.ClassName.methodName")
-        execution_logs: Dictionary mapping HTML full_name to execution_log
+        report_dir: Path to report directory containing html/ subdirectory
         
     Returns:
-        Execution log string if found, None otherwise
+        Dictionary mapping test full_name to duration in seconds
     """
-    if not execution_logs:
-        return None
-    
-    # Strategy 1: Exact match on testcaseName
-    if testcase_name in execution_logs:
-        return execution_logs[testcase_name]
-    
-    # Strategy 2: Extract class.method and try exact match
-    parts = testcase_name.split('.')
-    if len(parts) >= 2:
-        class_method = '.'.join(parts[-2:])  # Last two parts
-        if class_method in execution_logs:
-            return execution_logs[class_method]
-        
-        # Strategy 3: Try with cleaned class name (remove duplicates)
-        class_name = parts[-2]
-        method_name = parts[-1]
-        cleaned_class = remove_duplicate_class_name(class_name)
-        cleaned_class_method = f"{cleaned_class}.{method_name}"
-        if cleaned_class_method in execution_logs:
-            return execution_logs[cleaned_class_method]
-        
-        # Strategy 4: Try matching by method name only (case-insensitive)
-        method_lower = method_name.lower()
-        for html_full_name, log in execution_logs.items():
-            html_parts = html_full_name.split('.')
-            if len(html_parts) >= 1 and html_parts[-1].lower() == method_lower:
-                return log
-    
-    return None
+    _, _, durations = get_html_metadata(report_dir)
+    return durations
 
 
-def _find_matching_duration(testcase_name: str, durations: Dict[str, float]) -> Optional[float]:
+def _index_by_method_name(values_by_name: Dict[str, object]) -> Dict[str, object]:
     """
-    Find matching duration for a testcase name using multiple matching strategies.
+    Build a lowercased method name -> value index from a full_name keyed dictionary.
+    The first entry wins for each method name, matching a linear scan in insertion order.
+    """
+    index = {}
+    for full_name, value in values_by_name.items():
+        index.setdefault(full_name.rsplit('.', 1)[-1].lower(), value)
+    return index
+
+
+def _find_matching_html_data(testcase_name: str, execution_logs: Dict[str, str], durations: Dict[str, float],
+                             logs_by_method: Optional[Dict[str, str]] = None,
+                             durations_by_method: Optional[Dict[str, float]] = None) -> tuple[Optional[str], Optional[float]]:
+    """
+    Find the matching execution log and duration for a testcase name using multiple matching strategies.
+    The name is decomposed once and each candidate key is probed in both dictionaries.
     
     Args:
-        testcase_name: Test case name from database
+        testcase_name: Test case name from database (e.g., "ClassName.methodName" or "package.ClassName.methodName")
+        execution_logs: Dictionary mapping HTML full_name to execution_log
         durations: Dictionary mapping HTML full_name to duration
+        logs_by_method: Optional prebuilt _index_by_method_name(execution_logs), avoids a rebuild per call
+        durations_by_method: Optional prebuilt _index_by_method_name(durations), avoids a rebuild per call
         
     Returns:
-        Duration in seconds if found, None otherwise
+        Tuple of (execution_log, duration), each None if not found
     """
-    if not durations:
-        return None
-    
-    # Same matching strategies as execution logs
-    if testcase_name in durations:
-        return durations[testcase_name]
+    # Strategy 1: Exact match on testcaseName
+    candidate_names = [testcase_name]
     
-    parts = testcase_name.split('.')
-    if len(parts) >= 2:
-        class_method = '.'.join(parts[-2:])
-        if class_method in durations:
-            return durations[class_method]
-        
-        class_name = parts[-2]
-        method_name = parts[-1]
-        cleaned_class = remove_duplicate_class_name(class_name)
-        cleaned_class_method = f"{cleaned_class}.{method_name}"
-        if cleaned_class_method in durations:
-            return durations[cleaned_class_method]
-        
+    parent, sep, method_name = testcase_name.rpartition('.')
+    if sep:
+        class_name = parent.rpartition('.')[2]
+        # Strategy 2: Extract class.method and try exact match
+        candidate_names.append(f"{class_name}.{method_name}")
+        # Strategy 3: Try with cleaned class name (remove duplicates)
+        candidate_names.append(f"{remove_duplicate_class_name(class_name)}.{method_name}")
+    else:
+        method_name = None
+    
+    execution_log = None
+    duration = None
+    for name in candidate_names:
+        if execution_log is None and name in execution_logs:
+            execution_log = execution_logs[name]
+        if duration is None and name in durations:
+            duration = durations[name]
+    
+    # Strategy 4: Try matching by method name only (case-insensitive)
+    if method_name is not None:
         method_lower = method_name.lower()
-        for html_full_name, duration in durations.items():
-            html_parts = html_full_name.split('.')
-            if len(html_parts) >= 1 and html_parts[-1].lower() == method_lower:
-                return duration
-    
-    return None
+        if execution_log is None and execution_logs:
+            if logs_by_method is None:
+                logs_by_method = _index_by_method_name(execution_logs)
+            execution_log = logs_by_method.get(method_lower)
+        if duration is None and durations:
+            if durations_by_method is None:
+                durations_by_method = _index_by_method_name(durations)
+            duration = durations_by_method.get(method_lower)
+    
+    return execution_log, duration
 
 
-def get_full_report_data_from_db(report_dir: str, db_results: List[Dict], execution_logs: Dict[str, str], durations: Dict[str, float], html_links: Optional[Dict[str, str]] = None) -> dict:
+def get_full_report_data_from_db(report_dir: str, db_results: List[Dict], execution_logs: Dict[str, str], durations: Dict[str, float], html_links: Optional[Dict[str, str]] = None) -> ReportBundle:
     """
     Combine database results with HTML execution logs and create TestResult objects.
     Deduplicates test results by testcaseName (keeps one entry per unique test).
@@ -373,69 +384,58 @@ def get_full_report_data_from_db(report_dir: str, db_results: List[Dict], execut
         html_links: Optional dictionary mapping test full_name to HTML file URL
         
     Returns:
-        Dictionary with 'test_results', 'summary', 'report_dir', and 'html_links'
+        ReportBundle with test_results, summary, report_dir and html_links
     """
-    # First pass: collect all test results, grouped by testcaseName
-    test_results_by_name = {}
-    matched_logs = 0
-    matched_durations = 0
+    # First pass: rank the DB rows per testcaseName without building any TestResult.
+    # Deduplicate: keep only one entry per testcaseName, preferring the one with
+    # 1. Execution log, then 2. FAIL/ERROR status (higher score wins, first row on ties).
+    # Maps testcaseName -> (execution_log, duration, [(score, db_row), ...])
+    candidates_by_name = {}
+    
+    # Method-name indexes for the last-resort matching strategy, built once instead of per row
+    logs_by_method = _index_by_method_name(execution_logs) if execution_logs else {}
+    durations_by_method = _index_by_method_name(durations) if durations else {}
     
     for db_row in db_results:
         testcase_name = db_row.get('testcaseName', '')
         if not testcase_name:
             continue
         
-        # Find matching execution log and duration using flexible matching
-        execution_log = _find_matching_execution_log(testcase_name, execution_logs)
-        duration = _find_matching_duration(testcase_name, durations)
-        
-        try:
-            test_result = db_row_to_test_result(db_row, execution_log=execution_log, duration=duration)
-            
-            # Deduplicate: keep only one entry per testcaseName
-            if testcase_name not in test_results_by_name:
-                test_results_by_name[testcase_name] = test_result
-                if execution_log:
-                    matched_logs += 1
-                if duration:
-                    matched_durations += 1
-            else:
-                # If duplicate found, prefer the one with:
-                # 1. Execution log (if current doesn't have one)
-                # 2. FAIL/ERROR status (if current is PASS)
-                existing = test_results_by_name[testcase_name]
-                should_replace = False
-                
-                if execution_log and not existing.execution_log:
-                    should_replace = True
-                elif test_result.status in [TestStatus.FAIL, TestStatus.ERROR] and existing.status == TestStatus.PASS:
-                    should_replace = True
-                elif execution_log and existing.execution_log:
-                    # Both have logs, prefer FAIL over PASS
-                    if test_result.status in [TestStatus.FAIL, TestStatus.ERROR] and existing.status == TestStatus.PASS:
-                        should_replace = True
-                
-                if should_replace:
-                    test_results_by_name[testcase_name] = test_result
-                    if execution_log and not existing.execution_log:
-                        matched_logs += 1
-                    if duration and not existing.duration_seconds:
-                        matched_durations += 1
+        entry = candidates_by_name.get(testcase_name)
+        if entry is None:
+            # Find matching execution log and duration using flexible matching (once per name)
+            execution_log, duration = _find_matching_html_data(
+                testcase_name, execution_logs, durations, logs_by_method, durations_by_method
+            )
+            entry = candidates_by_name[testcase_name] = (execution_log, duration, [])
         
-        except Exception as e:
-            logger.warning(f"Failed to convert DB row to TestResult for {testcase_name}: {e}")
-            continue
-    
-    # Convert dict values to list
-    test_results = list(test_results_by_name.values())
+        # Malformed testStatus values score as PASS here; db_row_to_test_result rejects them below
+        status_str = db_row.get('testStatus') or ''
+        status = _STATUS_MAP.get(status_str.upper().strip() if isinstance(status_str, str) else '', TestStatus.PASS)
+        entry[2].append(((bool(entry[0]), status in FAILURE_STATUSES), db_row))
+    
+    # Second pass: build one TestResult per unique test, falling back to the
+    # next-best row when the winning row cannot be converted
+    test_results = []
+    for testcase_name, (execution_log, duration, candidates) in candidates_by_name.items():
+        # sort() is stable, so the first row still wins among equal scores
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        for _, db_row in candidates:
+            try:
+                test_results.append(db_row_to_test_result(db_row, execution_log=execution_log, duration=duration))
+                break
+            except Exception as e:
+                logger.warning("Failed to convert DB row to TestResult for %s: %s", testcase_name, e)
+    
+    matched_logs = sum(1 for result in test_results if result.execution_log)
+    matched_durations = sum(1 for result in test_results if result.duration_seconds)
     
     logger.info(f"Deduplicated: {len(db_results)} DB rows -> {len(test_results)} unique tests")
     logger.info(f"Matched execution logs: {matched_logs}/{len(test_results)} tests")
     logger.info(f"Matched durations: {matched_durations}/{len(test_results)} tests")
     
     # Calculate summary from deduplicated results
-    html_parser = HTMLReportParser()
-    summary = html_parser.get_summary_stats(test_results)
+    summary = HTMLReportParser.get_summary_stats(test_results)
     
     logger.info(f"Created {len(test_results)} unique TestResult objects from database (with HTML logs merged)")
     
@@ -462,11 +462,11 @@ def get_full_report_data_from_db(report_dir: str, db_results: List[Dict], execut
             logger.warning(f"Failed to build fallback HTML links: {e}")
             effective_links = {}
     
-    return {
-        'test_results': test_results,
-        'summary': summary,
-        'report_dir': report_dir,
-        'html_links': effective_links
-    }
+    return ReportBundle(
+        test_results=test_results,
+        summary=summary,
+        report_dir=report_dir,
+        html_links=effective_links
+    )
 
 
@@ -3,21 +3,278 @@ HTML Report Parser for TestNG/ReportNG HTML reports.
 Extracts complete execution logs including API calls, responses, and detailed error messages.
 """
 
+import os
 import re
+import sys
 import logging
-import warnings
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
-from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
+from typing import Dict, Iterator, List, Optional, Tuple
+from lxml import etree
+from lxml import html as lxml_html
 
 from .models import TestResult, TestStatus, TestSummary
-from ..utils import remove_duplicate_class_name
-
-# Suppress XMLParsedAsHTMLWarning - we're intentionally parsing HTML/XML hybrid files
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+from ..utils import SPAWN_CONTEXT, remove_duplicate_class_name
 
 logger = logging.getLogger(__name__)
 
+# overview.html is always written as UTF-8. One parser instance is shared by every parse.
+_OVERVIEW_PARSER = lxml_html.HTMLParser(encoding='utf-8', huge_tree=True)
+
+# Sections of a results file, in the order their results are yielded
+_SECTIONS = (
+    ('Failed Tests', TestStatus.FAIL),
+    ('Passed Tests', TestStatus.PASS),
+    ('Skipped Tests', TestStatus.SKIP),
+)
+
+# parse_all starts one worker process per this many bytes of HTML, and parses in-process below two.
+# A spawned worker re-imports the main module before it parses anything, which costs more than
+# parsing a few MB in-process
+_PARALLEL_BYTES_PER_WORKER = 16 * 1024 * 1024
+
+# parse_test_results memo keyed by (absolute path, mtime_ns, size) - an unchanged file is
+# never re-parsed within a process. Insertion-ordered, oldest entry evicted first.
+_PARSE_CACHE: Dict[Tuple[str, int, int], Tuple[TestResult, ...]] = {}
+_PARSE_CACHE_MAX_ENTRIES = 64
+
+# Test result files are decoded as latin-1 so stray bytes never break parsing.
+# An explicit encoding also overrides any <?xml ... encoding?> or <meta charset> in the file.
+_RESULTS_ENCODING = 'iso-8859-1'
+# Results files are streamed to the pull parser in chunks of this size
+_RESULTS_CHUNK_SIZE = 64 * 1024
+
+# Precompiled patterns - these run once per test row, so avoid re-resolving them through re's cache
+# Inline style of the <font> tags that hold execution log lines
+_LOG_FONT_STYLE = 'font-size:110%'
+_NBSP_TABLE = str.maketrans({'\xa0': ' '})
+# Platform package segment, case-insensitive. Each lookahead scans the whole name, so the
+# alternation keeps the API > MOBILE > WEB priority instead of taking the leftmost segment.
+_PLATFORM_RE = re.compile(r'(?=.*\.(api)\.)|(?=.*\.(mobile)\.)|(?=.*\.(web)\.)', re.IGNORECASE | re.DOTALL)
+# Plain "<seconds>s" durations as written by ReportNG (e.g. "83.182s") - parsed without try/except
+_DURATION_RE = re.compile(r'\s*(\d+(?:\.\d*)?|\.\d+)\s*s?\s*')
+# Platform names by _PLATFORM_RE group - every TestResult shares these string objects
+_PLATFORMS = {1: 'API', 2: 'MOBILE', 3: 'WEB'}
+
+# Every marker _extract_execution_log looks for, fused into one alternation so the log is
+# scanned once. Marker kinds match case-insensitively except the exception/stack-trace ones.
+_LOG_MARKERS_RE = re.compile(
+    r'(?P<method_args>(?i:Method arguments:))'
+    r'|(?P<started_testcase>(?i:Execution started for testcase))'
+    r'|(?P<started_test>(?i:Execution started for test))'
+    r'|(?P<details>(?i:Test Case Details))'
+    r'|(?P<exec_end>(?i:EXECUTION OF TESTCASE ENDS HERE))'
+    r'|(?P<selenium>(?i:org\.openqa\.selenium\.[\w]+Exception:))'
+    r'|(?P<java_exception>java\.lang\.[\w]+Exception:)'
+    r'|(?P<java_error>java\.lang\.[\w]+Error:)'
+    r'|(?P<assertion>AssertionError:)'
+    r'|(?P<stack_line>at [\w\.]+\([\w\.]+\.java:\d+\))'
+    r'|(?P<failure>(?i:Failure occurred in test))'
+    r'|(?P<total_time>(?i:Total time taken by Test))'
+)
+# Selenium exceptions only count as the end of a failure when their case matches exactly
+_SELENIUM_EXCEPTION_RE = re.compile(r'org\.openqa\.selenium\.[\w]+Exception:')
+
+# Start of a test case's log, in priority order ("Method arguments:" appears first, before execution starts)
+_START_MARKERS = ('method_args', 'started_testcase', 'started_test', 'details')
+# Exception patterns that mark the real end of a failed test's log, in priority order
+_EXCEPTION_MARKERS = ('selenium', 'java_exception', 'java_error', 'assertion', 'stack_line')
+# Start of the next test case's log
+_NEXT_TEST_MARKERS = ('method_args', 'started_testcase')
+_FAILURE_MARKERS = ('failure', 'total_time')
+# End markers used when "EXECUTION OF TESTCASE ENDS HERE" is missing
+_END_MARKERS = ('total_time', 'failure', 'selenium')
+
+
+def _first_marker(markers: Dict[str, Tuple[List[int], List[re.Match]]], kinds: Tuple[str, ...], pos: int,
+                  exact_selenium: bool = False) -> Optional[re.Match]:
+    """
+    Find the first marker at or after pos, trying each kind in priority order.
+    
+    Args:
+        markers: Marker (start offsets, matches) grouped by kind, from one _LOG_MARKERS_RE.finditer pass
+        kinds: Marker kinds in priority order
+        pos: Offset in the log to search from
+        exact_selenium: Only accept selenium exceptions whose case matches exactly
+        
+    Returns:
+        First match of the highest-priority kind that occurs at or after pos, or None
+    """
+    for kind in kinds:
+        entry = markers.get(kind)
+        if entry is None:
+            continue
+        starts, matches = entry
+        # Binary search past the earlier matches - huge logs can hold thousands of stack lines
+        for index in range(bisect_left(starts, pos), len(matches)):
+            match = matches[index]
+            if exact_selenium and kind == 'selenium' and not _SELENIUM_EXCEPTION_RE.fullmatch(match.group()):
+                continue
+            return match
+    return None
+
+
+def _has_class(element, class_name: str) -> bool:
+    """Check whether an element's class attribute contains the given class"""
+    return class_name in element.get('class', '').split()
+
+
+def _class_test(class_name: str) -> str:
+    """XPath predicate: the element's class attribute contains the given class token"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# One XPath evaluation per row / cell returns every node the row parser needs, instead of
+# a separate Python-level descendant walk per lookup
+_ROW_CELL_CLASSES = ('group', 'method', 'duration', 'result')
+_ROW_CELLS_XPATH = etree.XPath(
+    ".//td[" + " or ".join(_class_test(class_name) for class_name in _ROW_CELL_CLASSES) + "]"
+)
+_METHOD_CELL_XPATH = etree.XPath(".//a | .//span[" + _class_test('description') + "]")
+_TEST_OUTPUT_XPATH = etree.XPath("(.//div[" + _class_test('testOutput') + "])[1]")
+# Only evaluated for failed rows - passed/skipped rows have no exception block to look for
+_FAILURE_NODES_XPATH = etree.XPath(
+    ".//div[contains(@id, 'exception-')] | .//a[contains(@href, 'toggleElement')]"
+)
+
+# overview.html suite rows (class "test", at least six cells, a link in the first cell) and
+# their fields as plain strings: suite name, results file, duration, passed, skipped, failed
+_OVERVIEW_ROWS_XPATH = etree.XPath(".//tr[" + _class_test('test') + "][count(.//td) >= 6][(.//td)[1]//a]")
+_OVERVIEW_FIELD_XPATHS = tuple(etree.XPath(expression) for expression in (
+    "string(((.//td)[1]//a)[1])",
+    "string(((.//td)[1]//a)[1]/@href)",
+    "string((.//td)[2])",
+    "string((.//td)[3])",
+    "string((.//td)[4])",
+    "string((.//td)[5])",
+))
+
+
+def _row_cells(row) -> Dict[str, object]:
+    """First group/method/duration/result <td> under a row, keyed by class"""
+    cells = {}
+    for cell in _ROW_CELLS_XPATH(row):
+        for class_name in cell.get('class', '').split():
+            if class_name in _ROW_CELL_CLASSES and class_name not in cells:
+                cells[class_name] = cell
+    return cells
+
+
+def _method_cell_parts(method_cell) -> Tuple[Optional[object], Optional[object]]:
+    """First <a> and first <span class="description"> under a method cell"""
+    link = span = None
+    for element in _METHOD_CELL_XPATH(method_cell):
+        if element.tag == 'a':
+            if link is None:
+                link = element
+        elif span is None:
+            span = element
+    return link, span
+
+
+def _get_text(element, separator: str = '', strip: bool = False) -> str:
+    """
+    Text content of an element and its descendants (comments excluded).
+    
+    Args:
+        element: lxml element
+        separator: String placed between text nodes
+        strip: Strip each text node and drop the empty ones
+        
+    Returns:
+        Joined text content
+    """
+    if strip:
+        return separator.join(text for text in (text.strip() for text in element.itertext()) if text)
+    return separator.join(element.itertext())
+
+
+def _split_link_text(cell, link) -> Tuple[str, str]:
+    """
+    Stripped text of a cell, collected in one walk.
+    
+    Args:
+        cell: lxml element (e.g. a method <td>)
+        link: Descendant <a> whose text should be left out of the second result, or None
+        
+    Returns:
+        Tuple of (all text joined by spaces, text outside the link joined by spaces)
+    """
+    all_parts = []
+    outside_parts = []
+    in_link = False
+    for event, element in etree.iterwalk(cell, events=('start', 'end')):
+        if event == 'start':
+            if element is link:
+                in_link = True
+            # Comments and processing instructions don't contribute text, only their tails
+            text = element.text if isinstance(element.tag, str) else None
+        else:
+            if element is link:
+                in_link = False
+            text = element.tail if element is not cell else None
+        
+        if text:
+            text = text.strip()
+            if text:
+                all_parts.append(text)
+                if not in_link:
+                    outside_parts.append(text)
+    return ' '.join(all_parts), ' '.join(outside_parts)
+
+
+def _looks_like_method_name(text: str, check_case: bool = True) -> bool:
+    """
+    Check whether text looks like a Java method name rather than an English description.
+    
+    Args:
+        text: Candidate method name
+        check_case: Also require a lower-case first letter or a 'test' prefix (camelCase methods)
+        
+    Returns:
+        True if text has no spaces, is under 100 characters and passes the optional case check
+    """
+    if ' ' in text or len(text) >= 100:
+        return False
+    return not check_case or text[:1].islower() or text.startswith('test')
+
+
+@lru_cache(maxsize=1024)
+def _more_qualified_class(current_class: str, href_class: str) -> str:
+    """
+    Pick the more fully qualified of the current group class and a class name taken from a method href.
+    Every method row of a class repeats the same pair, so the segment counts are computed once per pair.
+    
+    Args:
+        current_class: Class name from the latest group row
+        href_class: Class part of the method link's href
+        
+    Returns:
+        href_class without a duplicated trailing class name if it has more package segments, else current_class
+    """
+    # CRITICAL: Remove duplicate class name if present
+    href_class = remove_duplicate_class_name(href_class)
+    # If href_class has more segments than current_class, use it
+    if href_class.count('.') > current_class.count('.'):
+        return href_class
+    return current_class
+
+
+def _element_string(element) -> Optional[str]:
+    """Text of an element whose only content is a single string (descending through lone children), else None"""
+    while True:
+        if len(element) == 0:
+            return element.text
+        if len(element) > 1 or element.text or element[0].tail:
+            return None
+        element = element[0]
+
+# Actual method name mentioned in an execution log
+_FAILURE_METHOD_RE = re.compile(r"Failure occurred in test '([^']+)' of Class")
+_TEST_METHOD_RE = re.compile(r"Test '([^']+)' of Class")
+
 
 class HTMLReportParser:
     """Parser for TestNG HTML reports with detailed execution logs"""
@@ -36,35 +293,24 @@ class HTMLReportParser:
         if not path.exists():
             raise FileNotFoundError(f"HTML file not found: {html_path}")
         
-        with open(html_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'lxml')
+        # overview.html is small and regular - use lxml + XPath directly, no BeautifulSoup tree
+        tree = lxml_html.parse(html_path, parser=_OVERVIEW_PARSER)
         
         test_suites = []
         
-        # Find all test rows in the overview table
-        for row in soup.find_all('tr', class_='test'):
-            cells = row.find_all('td')
-            if len(cells) >= 6:
-                # Extract test suite link
-                link_elem = cells[0].find('a')
-                if link_elem:
-                    suite_name = link_elem.text.strip()
-                    results_file = link_elem.get('href', '')
-                    
-                    # Extract pass/fail counts
-                    duration = cells[1].text.strip()
-                    passed = int(cells[2].text.strip())
-                    skipped = int(cells[3].text.strip())
-                    failed = int(cells[4].text.strip())
-                    
-                    test_suites.append({
-                        'name': suite_name,
-                        'results_file': results_file,
-                        'duration': duration,
-                        'passed': passed,
-                        'skipped': skipped,
-                        'failed': failed
-                    })
+        # Find all test rows in the overview table; each field comes back as a string, no cell elements
+        for row in _OVERVIEW_ROWS_XPATH(tree):
+            suite_name, results_file, duration, passed, skipped, failed = (
+                field_xpath(row) for field_xpath in _OVERVIEW_FIELD_XPATHS
+            )
+            test_suites.append({
+                'name': suite_name.strip(),
+                'results_file': results_file,
+                'duration': duration.strip(),
+                'passed': int(passed.strip()),
+                'skipped': int(skipped.strip()),
+                'failed': int(failed.strip())
+            })
         
         logger.info(f"Found {len(test_suites)} test suites in overview")
         return test_suites
@@ -79,279 +325,390 @@ class HTMLReportParser:
         Returns:
             List of TestResult objects with complete execution logs
         """
+        try:
+            stat = os.stat(html_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"HTML file not found: {html_path}")
+        
+        # Reruns over the same report (e.g. link lookups per test) reuse the previous parse
+        cache_key = (os.path.abspath(html_path), stat.st_mtime_ns, stat.st_size)
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # Cached as an exact-size tuple built straight from the stream; callers get their own list
+        results = tuple(self.iter_test_results(html_path))
+        _PARSE_CACHE[cache_key] = results
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAX_ENTRIES:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)), None)
+        return list(results)
+    
+    def iter_test_results(self, html_path: str) -> Iterator[TestResult]:
+        """
+        Lazily parse a test result HTML file, yielding one TestResult per test method row.
+        Results are yielded in section order: failed, passed, then skipped. Reports list the
+        sections in that order, so a section whose header has not appeared by the time a later
+        section's does is taken to be absent; should it still turn up, its rows are yielded as
+        they are parsed.
+        
+        Args:
+            html_path: Path to test results HTML file (e.g., suite1_test67_results.html)
+            
+        Yields:
+            TestResult objects with complete execution logs
+        """
         path = Path(html_path)
         if not path.exists():
             raise FileNotFoundError(f"HTML file not found: {html_path}")
         
-        with open(html_path, 'r', encoding='latin-1') as f:
-            content = f.read()
-            soup = BeautifulSoup(content, 'lxml')
+        # The parser rejects a completely empty file, which simply has no results
+        if path.stat().st_size == 0:
+            return
+        
+        # Stream the document through a pull parser instead of building the whole tree first.
+        # Each top-level row of a section table is parsed as soon as it is complete and then
+        # freed, so peak memory is one row (plus any non-section markup), not the whole file.
+        section_tables = {}  # section <table> element -> indexes into _SECTIONS
+        found_sections = set()
+        current_classes = [None] * len(_SECTIONS)
+        finished = [False] * len(_SECTIONS)
+        # Results of sections that can't be yielded yet (an earlier section is still open)
+        pending = [[] for _ in _SECTIONS]
+        next_section = 0
+        
+        for _, element in _iter_results_events(path):
+            if element.tag == 'th':
+                # The first header with a section's exact title marks that section's table
+                title = _element_string(element)
+                for index, (section_name, _) in enumerate(_SECTIONS):
+                    if index not in found_sections and title == section_name:
+                        found_sections.add(index)
+                        # Earlier sections not found by now are absent - don't hold this one's rows for them
+                        for earlier in range(index):
+                            if earlier not in found_sections:
+                                finished[earlier] = True
+                        table = next(element.iterancestors('table'), None)
+                        if table is None:
+                            finished[index] = True
+                        else:
+                            section_tables.setdefault(table, []).append(index)
+            
+            elif element.tag == 'tr':
+                parent = element.getparent()
+                table = next(element.iterancestors('table'), None)
+                indexes = section_tables.get(table) if table is not None else None
+                if not indexes:
+                    continue
+                
+                for index in indexes:
+                    status = _SECTIONS[index][1]
+                    # iter() includes rows of tables nested in this row, in document order
+                    for row in element.iter('tr'):
+                        current_classes[index], result = self._parse_test_row(
+                            row, current_classes[index], status
+                        )
+                        if result is None:
+                            continue
+                        if index <= next_section:
+                            yield result
+                        else:
+                            pending[index].append(result)
+                
+                # Free this row and the already-parsed rows before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+            
+            else:
+                for index in section_tables.pop(element, ()):
+                    finished[index] = True
+            
+            # Once the section being yielded is complete, release the next one's pending results
+            while next_section < len(_SECTIONS) and finished[next_section]:
+                next_section += 1
+                if next_section < len(_SECTIONS):
+                    yield from pending[next_section]
+                    pending[next_section] = []
+        
+        # Sections still open at the end of the document (or never found)
+        for index in range(next_section + 1, len(_SECTIONS)):
+            yield from pending[index]
+    
+    def parse_all(self, html_paths: List[str],
+                  workers: Optional[int] = None) -> Dict[str, List[Tuple[str, Optional[str], float]]]:
+        """
+        Parse many test result files, in parallel worker processes when there is enough HTML.
+        HTML parsing and log scanning are CPU-bound, so processes scale with cores where threads
+        would serialize on the GIL. Each file is streamed through parse_test_results_iter and
+        bypasses the parse_test_results memo, so only the (full_name, execution_log,
+        duration_seconds) tuples are kept and sent back from the workers.
         
-        results = []
+        Args:
+            html_paths: Paths to test results HTML files
+            workers: Number of worker processes. Default: one per core, but at most one per
+                _PARALLEL_BYTES_PER_WORKER of HTML. An explicit value skips the size threshold
+            
+        Returns:
+            Dictionary mapping each path to its list of (full_name, execution_log, duration_seconds)
+            tuples (empty for a file that could not be parsed - the error is logged)
+        """
+        if workers is None:
+            total_bytes = sum(_file_size(html_path) for html_path in html_paths)
+            workers = min(os.cpu_count() or 1, total_bytes // _PARALLEL_BYTES_PER_WORKER)
+        max_workers = min(workers, len(html_paths))
         
-        # Parse failed tests
-        failed_tests = self._parse_test_section(soup, content, 'Failed Tests', TestStatus.FAIL)
-        results.extend(failed_tests)
+        if max_workers < 2:
+            parsed = [_parse_results_file(html_path) for html_path in html_paths]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=SPAWN_CONTEXT) as executor:
+                parsed = list(executor.map(_parse_results_file, html_paths))
+        
+        results = {}
+        for html_path, (test_entries, error) in zip(html_paths, parsed):
+            if error:
+                logger.error("Failed to parse %s: %s", html_path, error)
+            results[html_path] = test_entries
+        return results
+    
+    def parse_test_results_iter(self, html_path: str) -> Iterator[Tuple[str, Optional[str], float]]:
+        """
+        Lazily parse a test result HTML file, yielding only what log/link/duration lookups need.
+        No TestResult list is accumulated, so each object can be freed right after its row.
         
-        # Parse passed tests
-        passed_tests = self._parse_test_section(soup, content, 'Passed Tests', TestStatus.PASS)
-        results.extend(passed_tests)
+        Args:
+            html_path: Path to test results HTML file
+            
+        Yields:
+            Tuples of (full_name, execution_log, duration_seconds)
+        """
+        for result in self.iter_test_results(html_path):
+            yield result.full_name, result.execution_log, result.duration_seconds
+    
+    def _parse_test_row(self, row, current_class: Optional[str], status: TestStatus) -> Tuple[Optional[str], Optional[TestResult]]:
+        """
+        Parse one <tr> of a Failed/Passed/Skipped section.
         
-        # Parse skipped tests
-        skipped_tests = self._parse_test_section(soup, content, 'Skipped Tests', TestStatus.SKIP)
-        results.extend(skipped_tests)
+        Args:
+            row: lxml <tr> element
+            current_class: Class name from the latest group row of this section
+            status: Status of the section the row belongs to
+            
+        Returns:
+            Tuple of (current_class, TestResult). current_class is updated by group rows
+            (and by fully qualified method links); TestResult is None for non-test rows.
+        """
+        cells = _row_cells(row)
         
-        return results
-    
-    def _parse_test_section(self, soup: BeautifulSoup, raw_html: str, section_name: str, status: TestStatus) -> List[TestResult]:
-        """Parse a specific section (Failed/Passed/Skipped) of test results"""
-        results = []
-        
-        # Find the section header
-        section_header = soup.find('th', string=section_name)
-        if not section_header:
-            return results
-        
-        # Find the table containing this section
-        table = section_header.find_parent('table')
-        if not table:
-            return results
-        
-        # Find all test method rows
-        current_class = None
-        for row in table.find_all('tr'):
-            # Check if this is a class name row
-            class_cell = row.find('td', class_='group')
-            if class_cell:
-                current_class = class_cell.text.strip()
-                
-                # CRITICAL: Remove duplicate class name if present in class_cell text
-                # Example: "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis.TestDashBusinessesApis"
-                # Should become: "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis"
-                current_class = remove_duplicate_class_name(current_class)
-                
-                continue
+        # Check if this is a class name row
+        class_cell = cells.get('group')
+        if class_cell is not None:
+            current_class = _get_text(class_cell).strip()
             
-            # Check if this is a test method row
-            method_cell = row.find('td', class_='method')
-            if method_cell and current_class:
-                # Extract test method name - need to get the actual Java method name, not the description
-                # In TestNG HTML reports, the method name is usually in the anchor tag's href
-                # Format: href="#ClassName.methodName" or href="html/ClassName.html#methodName"
-                
-                method_name = None
-                
-                # First, try to find an anchor tag (link) - this usually contains the actual method name
-                # Also check if href contains full qualified class name
-                method_link = method_cell.find('a')
-                if method_link:
-                    # Extract from href (e.g., href="#TestDashBusinessesApis.testComplianceCanApproveHighRiskKYB")
-                    # or href="#Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis.testComplianceCanApproveHighRiskKYB")
-                    href = method_link.get('href', '')
-                    if href:
-                        # Extract method name from anchor (format: #ClassName.methodName or html/file.html#methodName)
-                        if '#' in href:
-                            anchor_part = href.split('#')[-1]
-                            if '.' in anchor_part:
-                                # Format: ClassName.methodName or Full.Qualified.ClassName.methodName
-                                parts = anchor_part.split('.')
-                                method_name = parts[-1]  # Last part is method name
-                                
-                                # Check if href contains full qualified class name (more than 2 parts before method)
-                                if len(parts) >= 2:
-                                    # If we have multiple parts, the class name might be in the href
-                                    # Update current_class if href has full qualified name
-                                    potential_class = '.'.join(parts[:-1])
-                                    
-                                    # CRITICAL: Remove duplicate class name if present
-                                    potential_class = remove_duplicate_class_name(potential_class)
-                                    
-                                    # If potential_class has more segments than current_class, use it
-                                    if potential_class.count('.') > current_class.count('.'):
-                                        current_class = potential_class
-                                        logger.debug(f"Updated class name from href: {current_class}")
-                            else:
-                                # Format: #methodName (just the method name)
-                                method_name = anchor_part
-                        # If no #, check if it's a direct method name in the href
-                        elif '.' in href:
-                            # href might contain ClassName.methodName or Full.Qualified.ClassName.methodName
-                            parts = href.split('.')
-                            if len(parts) > 1:
-                                method_name = parts[-1]
-                                # Check if href has full qualified class name
-                                potential_class = '.'.join(parts[:-1])
-                                
-                                # CRITICAL: Remove duplicate class name if present
-                                potential_class = remove_duplicate_class_name(potential_class)
-                                
-                                if potential_class.count('.') > current_class.count('.'):
-                                    current_class = potential_class
-                                    logger.debug(f"Updated class name from href (no #): {current_class}")
-                
-                # If no link or couldn't extract, try span with description class
-                # Sometimes the title attribute has the method name
-                if not method_name:
-                    method_span = method_cell.find('span', class_='description')
-                    if method_span:
-                        # Check title attribute first
-                        title = method_span.get('title', '').strip()
-                        if title:
-                            # If title looks like a method name (no spaces, camelCase), use it
-                            if ' ' not in title and len(title) < 100 and (title[0].islower() or title.startswith('test')):
-                                method_name = title
-                            # If title contains ClassName.methodName format, extract method name
-                            elif '.' in title:
-                                parts = title.split('.')
-                                if len(parts) > 1:
-                                    potential_method = parts[-1]
-                                    # Verify it looks like a method name
-                                    if ' ' not in potential_method and len(potential_method) < 100:
-                                        method_name = potential_method
-                
-                # Fallback: try to extract from row id or cell id
-                if not method_name:
-                    row_id = row.get('id', '')
-                    if row_id and '.' in row_id:
-                        method_name = row_id.split('.')[-1]
+            # CRITICAL: Remove duplicate class name if present in class_cell text
+            # Example: "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis.TestDashBusinessesApis"
+            # Should become: "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis"
+            current_class = remove_duplicate_class_name(current_class)
+            
+            return current_class, None
+        
+        # Check if this is a test method row
+        method_cell = cells.get('method')
+        if method_cell is not None and current_class:
+            # Extract test method name - need to get the actual Java method name, not the description
+            # In TestNG HTML reports, the method name is usually in the anchor tag's href
+            # Format: href="#ClassName.methodName" or href="html/ClassName.html#methodName"
+            
+            method_name = None
+            
+            # First, try to find an anchor tag (link) - this usually contains the actual method name
+            # Also check if href contains full qualified class name
+            method_link, method_span = _method_cell_parts(method_cell)
+            if method_link is not None:
+                # Extract from href (e.g., href="#TestDashBusinessesApis.testComplianceCanApproveHighRiskKYB")
+                # or href="#Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis.testComplianceCanApproveHighRiskKYB")
+                href = method_link.get('href', '')
+                if href:
+                    # Extract method name from anchor (format: #ClassName.methodName or html/file.html#methodName)
+                    _, hash_sep, anchor_part = href.rpartition('#')
+                    if hash_sep:
+                        # Format: ClassName.methodName or Full.Qualified.ClassName.methodName
+                        # (last part is the method name), or just #methodName
+                        potential_class, dot, method_name = anchor_part.rpartition('.')
+                        if dot:
+                            # If we have multiple parts, the class name might be in the href
+                            # Update current_class if href has full qualified name
+                            qualified_class = _more_qualified_class(current_class, potential_class)
+                            if qualified_class != current_class:
+                                current_class = qualified_class
+                                logger.debug("Updated class name from href: %s", current_class)
+                    # If no #, check if it's a direct method name in the href
                     else:
-                        cell_id = method_cell.get('id', '')
-                        if cell_id and '.' in cell_id:
-                            method_name = cell_id.split('.')[-1]
-                
-                # Last resort: use cell text, but only if it looks like a method name
-                if not method_name:
-                    raw_text = method_cell.text.strip()
-                    # If it looks like a Java method name (no spaces, reasonable length, camelCase)
-                    if raw_text and ' ' not in raw_text and len(raw_text) < 100 and (raw_text[0].islower() or raw_text.startswith('test')):
-                        method_name = raw_text
-                
-                # Final fallback - try to extract from execution log if available
-                # The execution log usually starts with "Execution started for testcase - [description]"
-                # But we can also look for the method name in the log later
-                if not method_name:
-                    # Last resort: use description, but log a debug message
-                    method_name = method_cell.text.strip() or 'UnknownMethod'
-                    logger.debug(f"⚠️ Could not extract actual method name for {current_class}, using description: {method_name[:50]}")
-                    logger.debug(f"   This may cause deduplication issues. Please check HTML structure.")
-                
-                # Extract duration
-                duration_cell = row.find('td', class_='duration')
-                duration_str = duration_cell.text.strip() if duration_cell else '0s'
-                duration = self._parse_duration(duration_str)
-                
-                # Extract execution log and failure details
-                result_cell = row.find('td', class_='result')
-                execution_log = ''
-                error_message = None
-                stack_trace = None
-                error_type = None
-                
-                if result_cell:
-                    # Extract execution log from testOutput div
-                    test_output = result_cell.find('div', class_='testOutput')
-                    if test_output:
-                        execution_log = self._extract_execution_log(test_output, raw_html, method_name)
-                        
-                        # If method_name looks like a description (has spaces, long), try to extract actual method name from execution log
-                        if execution_log and (' ' in method_name or len(method_name) > 50):
-                            # Look for method name patterns in execution log
-                            # Pattern: "Failure occurred in test 'MethodName' of Class"
-                            method_match = re.search(r"Failure occurred in test '([^']+)' of Class", execution_log)
+                        # href might contain ClassName.methodName or Full.Qualified.ClassName.methodName
+                        potential_class, dot, potential_method = href.rpartition('.')
+                        if dot:
+                            method_name = potential_method
+                            # Check if href has full qualified class name
+                            qualified_class = _more_qualified_class(current_class, potential_class)
+                            if qualified_class != current_class:
+                                current_class = qualified_class
+                                logger.debug("Updated class name from href (no #): %s", current_class)
+            
+            # If no link or couldn't extract, try span with description class
+            # Sometimes the title attribute has the method name
+            if not method_name:
+                if method_span is not None:
+                    # Check title attribute first
+                    title = method_span.get('title', '').strip()
+                    if title:
+                        # If title looks like a method name (no spaces, camelCase), use it
+                        if _looks_like_method_name(title):
+                            method_name = title
+                        # If title contains ClassName.methodName format, extract method name
+                        elif '.' in title:
+                            potential_method = title.rpartition('.')[2]
+                            # Verify it looks like a method name
+                            if _looks_like_method_name(potential_method, check_case=False):
+                                method_name = potential_method
+            
+            # Fallback: try to extract from row id or cell id
+            if not method_name:
+                row_id = row.get('id', '')
+                if row_id and '.' in row_id:
+                    method_name = row_id.rpartition('.')[2]
+                else:
+                    cell_id = method_cell.get('id', '')
+                    if cell_id and '.' in cell_id:
+                        method_name = cell_id.rpartition('.')[2]
+            
+            # Last resort: use cell text, but only if it looks like a method name
+            if not method_name:
+                raw_text = _get_text(method_cell).strip()
+                # If it looks like a Java method name (no spaces, reasonable length, camelCase)
+                if raw_text and _looks_like_method_name(raw_text):
+                    method_name = raw_text
+            
+            # Final fallback - try to extract from execution log if available
+            # The execution log usually starts with "Execution started for testcase - [description]"
+            # But we can also look for the method name in the log later
+            if not method_name:
+                # Last resort: use description, but log a debug message
+                method_name = _get_text(method_cell).strip() or 'UnknownMethod'
+                logger.debug(f"⚠️ Could not extract actual method name for {current_class}, using description: {method_name[:50]}")
+                logger.debug(f"   This may cause deduplication issues. Please check HTML structure.")
+            
+            # Extract duration
+            duration_cell = cells.get('duration')
+            duration_str = _get_text(duration_cell).strip() if duration_cell is not None else '0s'
+            duration = self._parse_duration(duration_str)
+            
+            # Extract execution log and failure details
+            result_cell = cells.get('result')
+            execution_log = ''
+            error_message = None
+            stack_trace = None
+            error_type = None
+            
+            if result_cell is not None:
+                # Extract execution log from testOutput div
+                test_output = next(iter(_TEST_OUTPUT_XPATH(result_cell)), None)
+                if test_output is not None:
+                    execution_log = self._extract_execution_log(test_output, method_name)
+                    
+                    # If method_name looks like a description (has spaces, long), try to extract actual method name from execution log
+                    if execution_log and (' ' in method_name or len(method_name) > 50):
+                        # Look for method name patterns in execution log
+                        # Pattern: "Failure occurred in test 'MethodName' of Class"
+                        method_match = _FAILURE_METHOD_RE.search(execution_log)
+                        if method_match:
+                            potential_method = method_match.group(1)
+                            # Verify it looks like a method name
+                            if _looks_like_method_name(potential_method, check_case=False):
+                                logger.debug(f"Extracted actual method name '{potential_method}' from execution log for {current_class}")
+                                method_name = potential_method
+                        else:
+                            # Try another pattern: "Test 'MethodName' of Class"
+                            method_match = _TEST_METHOD_RE.search(execution_log)
                             if method_match:
                                 potential_method = method_match.group(1)
-                                # Verify it looks like a method name
-                                if ' ' not in potential_method and len(potential_method) < 100:
+                                if _looks_like_method_name(potential_method, check_case=False):
                                     logger.debug(f"Extracted actual method name '{potential_method}' from execution log for {current_class}")
                                     method_name = potential_method
-                            else:
-                                # Try another pattern: "Test 'MethodName' of Class"
-                                method_match = re.search(r"Test '([^']+)' of Class", execution_log)
-                                if method_match:
-                                    potential_method = method_match.group(1)
-                                    if ' ' not in potential_method and len(potential_method) < 100:
-                                        logger.debug(f"Extracted actual method name '{potential_method}' from execution log for {current_class}")
-                                        method_name = potential_method
-                    
-                    # Extract failure details if this is a failed test
-                    if status == TestStatus.FAIL:
-                        failure_details = self._extract_failure_details(result_cell, raw_html)
-                        error_message = failure_details.get('error_message')
-                        stack_trace = failure_details.get('stack_trace')
-                        error_type = failure_details.get('error_type', 'AssertionError')
-                
-                # Extract description (English description of what the test does)
-                # The description is typically the visible text content of the method cell
-                # In TestNG HTML reports, the cell usually contains:
-                # - A link/anchor with href pointing to method (method name is in href, not visible text)
-                # - Visible text that is the English description
-                description = None
-                
-                # Get the visible text content of the method cell
-                # This excludes the link text (which might be method name) and gets the actual description
-                # IMPORTANT: We want to get the text that is NOT part of the link/anchor
-                # The description is usually the visible text, while the method name is in the href
-                cell_text = method_cell.get_text(separator=' ', strip=True)
-                
-                # Remove any link text from cell_text to get pure description
-                # If there's a link, its text might be the method name, so we want the rest
-                if method_link:
-                    link_text = method_link.get_text(strip=True)
-                    # Remove link text from cell_text if it appears
-                    if link_text and link_text in cell_text:
-                        # Replace link text with empty string to get description
-                        description_text = cell_text.replace(link_text, '', 1).strip()
-                        if description_text:
-                            cell_text = description_text
-                
-                # If cell text exists and is different from method name, use it as description
-                # Descriptions typically have spaces (readable English) or are longer than method names
-                # Examples: "Verify that admin can do Aml search for person"
-                #           "Verify that AML is NOT triggered if update address of business"
-                if cell_text and cell_text != method_name:
-                    # If it has spaces (readable English) or is significantly longer, it's likely a description
-                    if ' ' in cell_text or len(cell_text) > len(method_name) + 5:
-                        description = cell_text
-                
-                # Also check for span with class 'description' - sometimes the description is explicitly there
-                method_span = method_cell.find('span', class_='description')
-                if method_span:
-                    span_text = method_span.get_text(strip=True)
-                    # Use span text if it looks like a description and is different from method name
-                    if span_text and span_text != method_name:
-                        if ' ' in span_text or len(span_text) > len(method_name):
-                            description = span_text
-                
-                # Fallback: if method_name itself looks like a description (has spaces), use it
-                # This handles edge cases where we couldn't extract the actual method name
-                if not description and method_name and ' ' in method_name:
-                    description = method_name
-                
-                # CRITICAL: Ensure no duplicate class name before creating TestResult
-                # Remove any duplicate that might have been introduced during parsing
-                current_class = remove_duplicate_class_name(current_class)
-                
-                # Determine platform from class name
-                platform = self._extract_platform(current_class)
                 
-                result = TestResult(
-                    class_name=current_class,
-                    method_name=method_name,
-                    status=status,
-                    duration_seconds=duration,
-                    error_type=error_type,
-                    error_message=error_message,
-                    stack_trace=stack_trace,
-                    platform=platform,
-                    execution_log=execution_log,  # Full execution log
-                    description=description  # English description
-                )
-                
-                results.append(result)
+                # Extract failure details if this is a failed test
+                if status is TestStatus.FAIL:
+                    failure_details = self._extract_failure_details(result_cell)
+                    error_message = failure_details.get('error_message')
+                    stack_trace = failure_details.get('stack_trace')
+                    error_type = failure_details.get('error_type', 'AssertionError')
+            
+            # Extract description (English description of what the test does)
+            # The description is typically the visible text content of the method cell
+            # In TestNG HTML reports, the cell usually contains:
+            # - A link/anchor with href pointing to method (method name is in href, not visible text)
+            # - Visible text that is the English description
+            description = None
+            
+            # Get the visible text content of the method cell
+            # This excludes the link text (which might be method name) and gets the actual description
+            # IMPORTANT: We want to get the text that is NOT part of the link/anchor
+            # The description is usually the visible text, while the method name is in the href
+            # Remove any link text from cell_text to get pure description
+            # If there's a link, its text might be the method name, so we want the rest.
+            # One walk over the cell yields both the full text and the text outside the link.
+            cell_text, description_text = _split_link_text(method_cell, method_link)
+            if description_text and description_text != cell_text:
+                cell_text = description_text
+            
+            # If cell text exists and is different from method name, use it as description
+            # Descriptions typically have spaces (readable English) or are longer than method names
+            # Examples: "Verify that admin can do Aml search for person"
+            #           "Verify that AML is NOT triggered if update address of business"
+            if cell_text and cell_text != method_name:
+                # If it has spaces (readable English) or is significantly longer, it's likely a description
+                if ' ' in cell_text or len(cell_text) > len(method_name) + 5:
+                    description = cell_text
+            
+            # Also check for span with class 'description' - sometimes the description is explicitly there
+            if method_span is not None:
+                span_text = _get_text(method_span, strip=True)
+                # Use span text if it looks like a description and is different from method name
+                if span_text and span_text != method_name:
+                    if ' ' in span_text or len(span_text) > len(method_name):
+                        description = span_text
+            
+            # Fallback: if method_name itself looks like a description (has spaces), use it
+            # This handles edge cases where we couldn't extract the actual method name
+            if not description and method_name and ' ' in method_name:
+                description = method_name
+            
+            # CRITICAL: Ensure no duplicate class name before creating TestResult
+            # Remove any duplicate that might have been introduced during parsing
+            # Interned: a suite has few distinct classes, so rows share one string per class
+            current_class = sys.intern(remove_duplicate_class_name(current_class))
+            if _looks_like_method_name(method_name, check_case=False):
+                method_name = sys.intern(method_name)
+            
+            # Determine platform from class name
+            platform = self._extract_platform(current_class)
+            
+            result = TestResult(
+                class_name=current_class,
+                method_name=method_name,
+                status=status,
+                duration_seconds=duration,
+                error_type=error_type,
+                error_message=error_message,
+                stack_trace=stack_trace,
+                platform=platform,
+                execution_log=execution_log,  # Full execution log
+                description=description  # English description
+            )
+            
+            return current_class, result
         
-        return results
+        return current_class, None
     
-    def _extract_execution_log(self, test_output_div, raw_html: str, method_name: str = None) -> str:
+    def _extract_execution_log(self, test_output_div, method_name: str = None) -> str:
         """
         Extract the complete execution log from the testOutput div for a specific test case.
         Captures everything from start to end, including:
@@ -362,42 +719,47 @@ class HTMLReportParser:
         """
         # Get all text content, preserving structure
         log_lines = []
+        append_line = log_lines.append
         
-        # Find all font tags with timestamps
-        for font_tag in test_output_div.find_all('font', style=re.compile('font-size:110%')):
-            text = font_tag.get_text(separator=' ', strip=True)
-            # Clean up HTML entities
-            text = text.replace('&nbsp', ' ').replace('&nbsp;', ' ')
+        # Find all font tags with timestamps (plain substring test - the style is a literal)
+        for font_tag in test_output_div.iterdescendants('font'):
+            if _LOG_FONT_STYLE not in font_tag.get('style', ''):
+                continue
+            text = ' '.join([part for part in map(str.strip, font_tag.itertext()) if part])
+            # Clean up HTML entities: the parser already decoded &nbsp; to U+00A0, so a single
+            # translate handles it; only double-escaped logs still contain a literal "&nbsp"
+            text = text.translate(_NBSP_TABLE)
+            if '&nbsp' in text:
+                text = text.replace('&nbsp', ' ')
             if text:
-                log_lines.append(text)
+                append_line(text)
         
         full_log = '\n'.join(log_lines)
         
-        # Isolate logs for this specific test case by finding start and end markers
-        # Start marker: "Method arguments:" (first) or "Execution started for testcase"
-        start_marker_patterns = [
-            r'Method arguments:',  # This appears first, before execution starts
-            r'Execution started for testcase',
-            r'Execution started for test',
-            r'Test Case Details'
-        ]
+        # Isolate logs for this specific test case by finding start and end markers.
+        # One pass collects every marker occurrence; the priority rules below only look them up.
+        # The scan is linear (no nested quantifiers) and the log is deliberately not capped -
+        # see below - so lookups are bounded instead: each kind keeps its sorted start offsets.
+        markers = {}
+        for match in _LOG_MARKERS_RE.finditer(full_log):
+            entry = markers.get(match.lastgroup)
+            if entry is None:
+                entry = markers[match.lastgroup] = ([], [])
+            entry[0].append(match.start())
+            entry[1].append(match)
         
         # Find the start of this test case's execution
-        start_idx = 0
-        for pattern in start_marker_patterns:
-            match = re.search(pattern, full_log, re.IGNORECASE)
-            if match:
-                start_idx = match.start()
-                break
+        start_match = _first_marker(markers, _START_MARKERS, 0)
+        start_idx = start_match.start() if start_match else 0
         
         # Find the end of this test case's execution
         # We need to capture everything including failure details after "EXECUTION OF TESTCASE ENDS HERE"
         end_idx = len(full_log)
         
         # First, find where "EXECUTION OF TESTCASE ENDS HERE" appears
-        execution_end_match = re.search(r'EXECUTION OF TESTCASE ENDS HERE', full_log[start_idx:], re.IGNORECASE)
+        execution_end_match = _first_marker(markers, ('exec_end',), start_idx)
         if execution_end_match:
-            execution_end_pos = start_idx + execution_end_match.end()
+            execution_end_pos = execution_end_match.end()
             
             # After "EXECUTION OF TESTCASE ENDS HERE", we need to capture:
             # - Screenshot info
@@ -407,51 +769,30 @@ class HTMLReportParser:
             # - The actual exception/stack trace
             
             # Look for the exception/stack trace - this is the real end
-            # Common exception patterns
-            exception_patterns = [
-                r'org\.openqa\.selenium\.[\w]+Exception:',  # Selenium exceptions
-                r'java\.lang\.[\w]+Exception:',  # Java exceptions
-                r'java\.lang\.[\w]+Error:',  # Java errors
-                r'AssertionError:',  # Assertion errors
-                r'at [\w\.]+\([\w\.]+\.java:\d+\)',  # Stack trace line
-            ]
-            
-            # Search for exception after execution ends
-            remaining_after_end = full_log[execution_end_pos:]
-            exception_found = False
-            
-            for pattern in exception_patterns:
-                exception_match = re.search(pattern, remaining_after_end)
-                if exception_match:
-                    # Found exception, capture everything up to and including it
-                    # Also capture some lines after the exception for full context
-                    exception_pos = execution_end_pos + exception_match.end()
-                    # Look for end of exception (usually blank line or next test case start)
-                    # Capture at least 2000 chars after exception start to get full stack trace
-                    end_idx = min(exception_pos + 2000, len(full_log))
-                    
-                    # But also check if there's a next test case starting
-                    next_test_match = re.search(r'Method arguments:|Execution started for testcase', remaining_after_end[exception_match.end():], re.IGNORECASE)
-                    if next_test_match:
-                        end_idx = execution_end_pos + exception_match.end() + next_test_match.start()
-                    
-                    exception_found = True
-                    break
-            
-            if not exception_found:
+            exception_match = _first_marker(markers, _EXCEPTION_MARKERS, execution_end_pos, exact_selenium=True)
+            if exception_match:
+                # Found exception, capture everything up to and including it
+                # Also capture some lines after the exception for full context
+                exception_pos = exception_match.end()
+                # Look for end of exception (usually blank line or next test case start)
+                # Capture at least 2000 chars after exception start to get full stack trace
+                end_idx = min(exception_pos + 2000, len(full_log))
+                
+                # But also check if there's a next test case starting
+                next_test_starts = [
+                    match.start()
+                    for match in (_first_marker(markers, (kind,), exception_pos) for kind in _NEXT_TEST_MARKERS)
+                    if match
+                ]
+                if next_test_starts:
+                    end_idx = min(next_test_starts)
+            else:
                 # No exception found, but we have execution end marker
                 # Look for "Failure occurred in test" or "Total time taken by Test" as end markers
-                failure_markers = [
-                    r'Failure occurred in test',
-                    r'Total time taken by Test'
-                ]
-                
-                for pattern in failure_markers:
-                    failure_match = re.search(pattern, remaining_after_end, re.IGNORECASE)
-                    if failure_match:
-                        # Capture everything including failure message
-                        end_idx = execution_end_pos + failure_match.end() + 1000  # Add extra for failure details
-                        break
+                failure_match = _first_marker(markers, _FAILURE_MARKERS, execution_end_pos)
+                if failure_match:
+                    # Capture everything including failure message
+                    end_idx = failure_match.end() + 1000  # Add extra for failure details
                 else:
                     # If no failure markers found, capture everything after execution end
                     # But limit to reasonable size (5000 chars after execution end)
@@ -459,18 +800,9 @@ class HTMLReportParser:
         else:
             # No "EXECUTION OF TESTCASE ENDS HERE" marker found
             # Try to find other end markers
-            end_marker_patterns = [
-                r'Total time taken by Test',
-                r'Failure occurred in test',
-                r'org\.openqa\.selenium\.[\w]+Exception:',  # Exception as end marker
-            ]
-            
-            for pattern in end_marker_patterns:
-                remaining_log = full_log[start_idx:]
-                match = re.search(pattern, remaining_log, re.IGNORECASE)
-                if match:
-                    end_idx = start_idx + match.end() + 2000  # Include exception/stack trace
-                    break
+            match = _first_marker(markers, _END_MARKERS, start_idx)
+            if match:
+                end_idx = match.end() + 2000  # Include exception/stack trace
         
         # Extract only the logs for this specific test case
         isolated_log = full_log[start_idx:end_idx]
@@ -487,7 +819,7 @@ class HTMLReportParser:
         
         return isolated_log
     
-    def _extract_failure_details(self, result_cell, raw_html: str) -> Dict:
+    def _extract_failure_details(self, result_cell) -> Dict:
         """Extract assertion error and stack trace from failed test"""
         details = {
             'error_type': 'AssertionError',
@@ -495,11 +827,19 @@ class HTMLReportParser:
             'stack_trace': ''
         }
         
+        # One precompiled XPath finds both the exception div and the toggle link
+        exception_div = error_link = None
+        for element in _FAILURE_NODES_XPATH(result_cell):
+            if element.tag == 'a':
+                if error_link is None:
+                    error_link = element
+            elif exception_div is None:
+                exception_div = element
+        
         # Look for exception divs
-        exception_div = result_cell.find('div', id=re.compile('exception-'))
-        if exception_div:
+        if exception_div is not None:
             # Get the full stack trace
-            stack_trace_text = exception_div.get_text(separator='\n', strip=True)
+            stack_trace_text = _get_text(exception_div, separator='\n', strip=True)
             details['stack_trace'] = stack_trace_text
             
             # Extract error message (first line usually)
@@ -508,9 +848,8 @@ class HTMLReportParser:
                 details['error_message'] = lines[0][:500]  # First line, max 500 chars
         
         # Also look for the assertion error link
-        error_link = result_cell.find('a', href=re.compile('toggleElement'))
-        if error_link:
-            error_text = error_link.get_text(separator=' ', strip=True)
+        if error_link is not None:
+            error_text = _get_text(error_link, separator=' ', strip=True)
             if error_text and not details['error_message']:
                 details['error_message'] = error_text[:500]
         
@@ -528,59 +867,50 @@ class HTMLReportParser:
           -> "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis"
         - "TestDashBusinessesApis.TestDashBusinessesApis"
           -> "TestDashBusinessesApis"
-        """
-        if not class_name or '.' not in class_name:
-            return class_name
-        
-        parts = class_name.split('.')
-        if len(parts) < 2:
-            return class_name
-        
-        # Remove consecutive duplicates anywhere in the string
-        # Check for consecutive duplicate segments
-        cleaned_parts = []
-        i = 0
-        while i < len(parts):
-            # Add current part
-            cleaned_parts.append(parts[i])
-            # Skip next part if it's the same as current (duplicate)
-            if i + 1 < len(parts) and parts[i] == parts[i + 1]:
-                logger.debug(f"Removed duplicate class name '{parts[i]}' from '{class_name}'")
-                i += 2  # Skip both the current and duplicate
-            else:
-                i += 1
         
-        cleaned = '.'.join(cleaned_parts)
-        return cleaned
+        Delegates to the memoized utils.remove_duplicate_class_name.
+        """
+        return remove_duplicate_class_name(class_name)
     
-    def _extract_platform(self, class_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _extract_platform(class_name: str) -> str:
         """Extract platform (WEB/API/MOBILE) from class name"""
-        class_lower = class_name.lower()
-        
-        if '.api.' in class_lower:
-            return 'API'
-        elif '.mobile.' in class_lower:
-            return 'MOBILE'
-        elif '.web.' in class_lower:
-            return 'WEB'
-        else:
-            return 'UNKNOWN'
+        match = _PLATFORM_RE.match(class_name)
+        return _PLATFORMS[match.lastindex] if match else 'UNKNOWN'
     
     def _parse_duration(self, duration_str: str) -> float:
         """Parse duration string (e.g., '83.182s') to float seconds"""
+        match = _DURATION_RE.fullmatch(duration_str)
+        if match:
+            return float(match.group(1))
+        
+        # Anything unusual (exponents, signs, stray 's' characters) keeps the lenient float() parse
         try:
             return float(duration_str.replace('s', '').strip())
         except ValueError:
             return 0.0
     
-    def get_summary_stats(self, results: List[TestResult]) -> TestSummary:
-        """Calculate summary statistics from test results"""
+    @staticmethod
+    def get_summary_stats(results: List[TestResult]) -> TestSummary:
+        """Calculate summary statistics from test results (single pass, no parser state needed)"""
+        passed = failed = errors = skipped = 0
+        duration = 0
+        # Identity checks on the enum members avoid Enum.__hash__, which runs in Python, per result
+        status_pass, status_fail = TestStatus.PASS, TestStatus.FAIL
+        status_error, status_skip = TestStatus.ERROR, TestStatus.SKIP
+        for r in results:
+            status = r.status
+            if status is status_pass:
+                passed += 1
+            elif status is status_fail:
+                failed += 1
+            elif status is status_error:
+                errors += 1
+            elif status is status_skip:
+                skipped += 1
+            duration += r.duration_seconds
         total = len(results)
-        passed = sum(1 for r in results if r.status == TestStatus.PASS)
-        failed = sum(1 for r in results if r.status == TestStatus.FAIL)
-        errors = sum(1 for r in results if r.status == TestStatus.ERROR)
-        skipped = sum(1 for r in results if r.status == TestStatus.SKIP)
-        duration = sum(r.duration_seconds for r in results)
         
         return TestSummary(
             total=total,
@@ -590,3 +920,49 @@ class HTMLReportParser:
             errors=errors,
             duration_seconds=duration
         )
+
+
+def _iter_results_events(path: Path) -> Iterator[Tuple[str, object]]:
+    """
+    Stream the 'end' events of a results file's th/tr/table elements.
+    etree.iterparse silently ignores huge_tree in HTML mode, so an HTMLPullParser is fed instead:
+    verbose suites can hold log text nodes beyond libxml2's default 10MB limit, which would
+    otherwise cut the document off at that row.
+    
+    Args:
+        path: Path to a test results HTML file
+        
+    Yields:
+        (event, element) tuples, as from etree.iterparse
+    """
+    parser = etree.HTMLPullParser(
+        events=('end',), tag=('th', 'tr', 'table'), encoding=_RESULTS_ENCODING, huge_tree=True
+    )
+    with open(path, 'rb') as results_file:
+        while True:
+            chunk = results_file.read(_RESULTS_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from parser.read_events()
+    parser.close()
+    yield from parser.read_events()
+
+
+def _file_size(path: str) -> int:
+    """Size of a file in bytes, 0 if it can't be stat()-ed"""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _parse_results_file(html_path: str) -> Tuple[List[Tuple[str, Optional[str], float]], Optional[str]]:
+    """
+    Worker for parse_all - module-level so it can be pickled into a worker process.
+    Errors are returned instead of raised, so one bad file doesn't lose every other file's results.
+    """
+    try:
+        return list(HTMLReportParser().parse_test_results_iter(html_path)), None
+    except Exception as e:
+        return [], str(e)
@@ -2,21 +2,38 @@
 Data models for test results and summaries.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from enum import Enum
-from ..utils import remove_duplicate_class_name
+from ..utils import remove_duplicate_class_name, TestNameNormalizer
 
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-class TestStatus(Enum):
+
+class TestStatus(str, Enum):
     """Test execution status"""
+    # The str mixin gives members C-level __hash__/__eq__ (Enum's own __hash__ runs in Python),
+    # so set membership like FAILURE_STATUSES stays cheap; .value keeps the "PASS"/"FAIL" strings
     PASS = "PASS"
     FAIL = "FAIL"
     SKIP = "SKIP"
     ERROR = "ERROR"
 
 
-@dataclass
+# Statuses that count as a failure (hashed membership, no per-call list)
+FAILURE_STATUSES = frozenset({TestStatus.FAIL, TestStatus.ERROR})
+
+# TestResult.__repr__ text around the name, per status: ("<icon> ", " (<STATUS>)").
+# Built once - Enum .value is a property lookup, slower than the concatenation itself
+_REPR_PARTS = {
+    status: ("✅ " if status is TestStatus.PASS else "❌ ", f" ({status.value})")
+    for status in TestStatus
+}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class TestResult:
     """Represents a single test case result"""
     class_name: str
@@ -29,28 +46,40 @@ class TestResult:
     platform: Optional[str] = None  # WEB, API, MOBILE
     execution_log: Optional[str] = None  # NEW: Complete execution log from HTML
     description: Optional[str] = None  # English description of what the test case does
+    _full_name: str = field(init=False, repr=False, compare=False)
+    _normalized_name: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def full_name(self) -> str:
-        """Get fully qualified test name"""
+    def __post_init__(self):
         # CRITICAL: Remove duplicate class names if present
         # Example: "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis.TestDashBusinessesApis"
         # Should become: "Automation.Access.AccountOpening.api.dash.TestDashBusinessesApis"
+        # The instance is frozen, so the name is built once here instead of on every access
         cleaned_class_name = remove_duplicate_class_name(self.class_name)
-        return f"{cleaned_class_name}.{self.method_name}"
+        object.__setattr__(self, '_full_name', f"{cleaned_class_name}.{self.method_name}")
+        object.__setattr__(self, '_normalized_name', TestNameNormalizer.normalize(self._full_name))
+    
+    @property
+    def full_name(self) -> str:
+        """Get fully qualified test name"""
+        return self._full_name
+    
+    @property
+    def normalized_name(self) -> str:
+        """Get the full name as normalized by TestNameNormalizer"""
+        return self._normalized_name
     
     
     @property
     def is_failure(self) -> bool:
         """Check if test failed or errored"""
-        return self.status in [TestStatus.FAIL, TestStatus.ERROR]
+        return self.status in FAILURE_STATUSES
     
     def __repr__(self) -> str:
-        status_icon = "✅" if self.status == TestStatus.PASS else "❌"
-        return f"{status_icon} {self.full_name} ({self.status.value})"
+        prefix, suffix = _REPR_PARTS[self.status]
+        return prefix + self.full_name + suffix
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class TestSummary:
     """Summary statistics for a test run"""
     total: int
@@ -74,7 +103,29 @@ class TestSummary:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
+class ReportBundle:
+    """Merged report data returned by get_full_report_data_from_db"""
+    test_results: List[TestResult]
+    summary: TestSummary
+    report_dir: str
+    html_links: Dict[str, str] = field(default_factory=dict)
+    
+    def __getitem__(self, key: str):
+        """Allow dict-style access (bundle['summary']) for older callers"""
+        if key not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default=None):
+        """Dict-style get() for older callers"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+@dataclass(**_SLOTS)
 class FailureSummary:
     """Represents a failure from CSV summary"""
     testrail_id: str
@@ -4,13 +4,240 @@ Provides a clean, maintainable way to reclassify test failures into root cause c
 """
 
 import re
+import hashlib
 import logging
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
 from ..agent.analyzer import FailureClassification
-from ..utils import TestDataCache
+from ..utils import SPAWN_CONTEXT, TestDataCache
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# classify() memo keyed by (rule classes, root cause, recommended action, initial category, combined log
+# digest). The category depends only on these, main.py and the report generator classify the same
+# failures, and suites repeat the same failure text across tests. Keying on a digest keeps the logs
+# themselves out of the memo. Insertion-ordered, oldest entry evicted first; clear_classify_cache() empties it.
+_CLASSIFY_CACHE: Dict[tuple, str] = {}
+_CLASSIFY_CACHE_MAX_ENTRIES = 8192
+
+# Category priority mapping (higher number = higher priority)
+# Order: TIMEOUT > ELEMENT_NOT_FOUND > ASSERTION_FAILURE > ENVIRONMENT_ISSUE > OTHER
+_CATEGORY_PRIORITY = {
+    'TIMEOUT': 15,
+    'ELEMENT_NOT_FOUND': 12,
+    'ASSERTION_FAILURE': 8,
+    'ENVIRONMENT_ISSUE': 6,
+    'OTHER': 1
+}
+_TOP_CATEGORY_PRIORITY = max(_CATEGORY_PRIORITY.values())
+
+# Python's \s on ASCII text, spelled out for RE2, whose \s leaves out \v and \x1c-\x1f
+_ASCII_WHITESPACE = r"[\t-\r\x1c-\x1f ]"
+
+
+def _compile_linear(pattern: str):
+    """
+    Compile a case-sensitive pattern for lowercased ASCII text, with RE2 when it is installed.
+    RE2 matches in time linear in the text, where re can backtrack quadratically. It has no
+    lookarounds, so only patterns without them may be passed here.
+    
+    Args:
+        pattern: Regex pattern without lookarounds
+        
+    Returns:
+        Compiled pattern with a search() method
+    """
+    if RE2_AVAILABLE:
+        return re2.compile(pattern.replace(r"\s", _ASCII_WHITESPACE))
+    return re.compile(pattern)
+
+
+# Precompiled patterns - every rule runs once per failure, against logs that can be many KB.
+# Page load timeout: "'DashReviewPage' NOT loaded even after :- 40.071 seconds"
+# Case-insensitive, so this also covers the lowercase "'PageName' not loaded even after" form
+# The quoted name is a non-empty run without quotes containing "Page" after its first character.
+# That is checked with a lookahead before the run is consumed: "[^'\"]+Page[^'\"]*" backtracked
+# over every "page" in a long quoted run, quadratic on verbose logs. Giving back characters of
+# "[^'\"]*" fails at once (the closing quote must follow), so this stays linear without needing
+# possessive quantifiers, which Python only supports from 3.11
+_QUOTED_PAGE_NAME = r"['\"](?=[^'\"]+?Page)[^'\"]*['\"]"
+_PAGE_NOT_LOADED_PATTERN = _QUOTED_PAGE_NAME + r"\s+(?:NOT|not)\s+loaded\s+even\s+after"
+_PAGE_NOT_LOADED_RE = re.compile(_PAGE_NOT_LOADED_PATTERN, re.IGNORECASE)
+_PAGE_NOT_LOADED_SHORT_RE = re.compile(_QUOTED_PAGE_NAME + r"\s+not\s+loaded", re.IGNORECASE)
+
+# Every valid timeout, as one alternation so each text is scanned once instead of once per pattern:
+# - page load timeout (above)
+# - element visibility: "Element 'PageName:element' is NOT visible [and clickable] even after waiting for X seconds"
+# - TimeoutException while waiting for an element to be clickable/visible
+# The stricter "... :- X seconds", "org.openqa.selenium.TimeoutException" and "Expected condition
+# failed" variants the rules used to check separately only match where these already do.
+# A scan from one TimeoutException stops at the next: a later one on the line can only match where
+# the earlier one would, and rescanning the rest of the line per occurrence was quadratic
+_VALID_TIMEOUT_RE = re.compile(
+    _PAGE_NOT_LOADED_PATTERN +
+    r"|Element\s+['\"][^'\"]+['\"]\s+is\s+(?:NOT|not)\s+visible(?:\s+and\s+clickable)?\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds"
+    r"|TimeoutException(?:(?!TimeoutException).)*?waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)",
+    re.IGNORECASE
+)
+# Lowercase words every _VALID_TIMEOUT_RE match contains (one per alternative)
+_VALID_TIMEOUT_TOKENS = ('loaded', 'visible', 'timeoutexception')
+
+# Assertion messages (matched against lowercased text)
+_ASSERTION_MESSAGE_PATTERNS = (
+    # Pattern: "Expected 'X' was :-'Y'. But actual is 'Z'"
+    # Quadratic under backtracking on long quote-free runs repeating "expected" - see _compile_linear
+    re.compile(r"expected\s+['\"]?[^'\"]+['\"]?\s+was\s*[:-]\s*['\"]?[^'\"]+['\"]?\s*\.?\s*but\s+actual\s+is", re.IGNORECASE),
+    # Pattern: "Expected 'X' but actual"
+    # The scan stops at the first ".", "expected" or "but actual" - like TimeoutException above,
+    # a later "expected" can only match where an earlier one would
+    re.compile(r"expected\s(?:[^.eb]|e(?!xpected\s)|b(?!ut\s+actual))*but\s+actual", re.IGNORECASE),
+    # Pattern: "Classes of actual and expected key"
+    re.compile(r"classes\s+of\s+actual\s+and\s+expected\s+key", re.IGNORECASE),
+    # Pattern: "Missing Key:"
+    re.compile(r"missing\s+(?:key|field)\s*:", re.IGNORECASE),
+    # Pattern: "Actual JSON doesn't contain all expected keys"
+    re.compile(r"actual\s+json\s+doesn'?t\s+contain\s+all\s+expected\s+keys", re.IGNORECASE),
+    # Pattern: "Key/Value is null"
+    re.compile(r"key\s*/\s*value\s+is\s+null", re.IGNORECASE),
+    # Pattern: "The following asserts failed"
+    re.compile(r"the\s+following\s+asserts\s+failed", re.IGNORECASE),
+)
+_EXPECTED_WORD_RE = re.compile(r"\bexpected\b", re.IGNORECASE)
+_ACTUAL_WORD_RE = re.compile(r"\bactual\b", re.IGNORECASE)
+# Case-sensitive twins for lowercased ASCII text, where they match exactly the same spans.
+# Without IGNORECASE the regex engine can scan for each pattern's literal prefix, roughly 15x faster
+_ASSERTION_MESSAGE_PATTERNS_LOWER = (_compile_linear(_ASSERTION_MESSAGE_PATTERNS[0].pattern),) + tuple(
+    re.compile(p.pattern) for p in _ASSERTION_MESSAGE_PATTERNS[1:]
+)
+_EXPECTED_WORD_LOWER_RE = re.compile(_EXPECTED_WORD_RE.pattern)
+_ACTUAL_WORD_LOWER_RE = re.compile(_ACTUAL_WORD_RE.pattern)
+# Every assertion pattern above contains at least one of these words
+_ASSERTION_TOKENS = ('actual', 'missing', 'value', 'asserts')
+
+# Exception names the rules look for (lowercase). _exception_names checks each one once per
+# text, so the rules test set membership instead of rescanning the log per name.
+_EXCEPTION_NAMES = (
+    'elementclickinterceptedexception',
+    'staleelementreferenceexception',
+    'nullpointerexception',
+    'indexoutofboundsexception',
+    'stringindexoutofboundsexception',
+    'illegalargumentexception',
+    'nosuchelementexception',
+    'timeoutexception',
+    'webdriverexception',
+)
+# Exceptions that mean a failure is clearly not an assertion failure
+_NOT_ASSERTION_EXCEPTIONS = frozenset({
+    'nosuchelementexception',
+    'elementclickinterceptedexception',
+    'staleelementreferenceexception',
+    'timeoutexception',
+    'webdriverexception',
+})
+
+
+def _exception_names(text_lower: str) -> FrozenSet[str]:
+    """
+    Find which _EXCEPTION_NAMES occur in a lowercased text.
+    Computed once per failure so the rules do set lookups instead of rescanning the text per name.
+    
+    Args:
+        text_lower: Lowercased text (e.g. an execution log)
+        
+    Returns:
+        Set of the names that occur in the text
+    """
+    return frozenset(name for name in _EXCEPTION_NAMES if name in text_lower)
+
+
+def _search_any(patterns, *texts: str) -> bool:
+    """True if any of the compiled patterns matches any of the texts"""
+    return any(pattern.search(text) for pattern in patterns for text in texts)
+
+
+def _may_match(text: str, text_lower: str, tokens: Tuple[str, ...]) -> bool:
+    """
+    Substring prefilter for a case-insensitive pattern - False only when the pattern can't match text.
+    Non-ASCII text always passes: re.IGNORECASE also folds 'ſ' to 's' and 'ı'/'İ' to 'i', str.lower() doesn't.
+    
+    Args:
+        text: Text the pattern would be searched in
+        text_lower: text.lower()
+        tokens: Lowercase words of which every match contains at least one
+        
+    Returns:
+        True if the (much slower) regex search still has to run
+    """
+    return not text.isascii() or any(token in text_lower for token in tokens)
+
+
+@dataclass
+class RuleContext:
+    """Per-failure text shared by every rule, so each string is fetched and lowercased once"""
+    root_cause: str
+    root_cause_lower: str
+    # f"{root_cause} {recommended_action}".lower()
+    combined_text: str
+    execution_log: str
+    execution_log_lower: str
+    # _EXCEPTION_NAMES found in combined_text / execution_log_lower
+    combined_exceptions: FrozenSet[str]
+    execution_log_exceptions: FrozenSet[str]
+    # _has_valid_timeout() result - both timeout rules need it, so it is computed on first use only
+    valid_timeout: Optional[bool] = None
+    
+    @classmethod
+    def from_log(cls, failure: FailureClassification, execution_log: str,
+                 execution_log_lower: Optional[str] = None) -> 'RuleContext':
+        """
+        Build the context for one failure from its combined execution log.
+        
+        Args:
+            failure: FailureClassification object
+            execution_log: Combined execution log of the failed test
+            execution_log_lower: execution_log.lower(), if already computed
+            
+        Returns:
+            RuleContext with the root cause, recommended action and combined execution log
+        """
+        if execution_log_lower is None:
+            execution_log_lower = execution_log.lower()
+        root_cause = failure.root_cause or ""
+        root_cause_lower = root_cause.lower()
+        # Same as lowercasing the joined text - the space keeps each part's case mapping independent
+        combined_text = f"{root_cause_lower} {(failure.recommended_action or '').lower()}"
+        return cls(
+            root_cause=root_cause,
+            root_cause_lower=root_cause_lower,
+            combined_text=combined_text,
+            execution_log=execution_log,
+            execution_log_lower=execution_log_lower,
+            combined_exceptions=_exception_names(combined_text),
+            execution_log_exceptions=_exception_names(execution_log_lower)
+        )
+
+
+def _has_valid_timeout(ctx: RuleContext) -> bool:
+    """True if the root cause or execution log contains a page load, element visibility or element TimeoutException timeout"""
+    if ctx.valid_timeout is None:
+        # Most failures mention none of the timeout keywords, so a substring check skips the regex
+        ctx.valid_timeout = bool(
+            (_may_match(ctx.root_cause, ctx.root_cause_lower, _VALID_TIMEOUT_TOKENS) and
+             _VALID_TIMEOUT_RE.search(ctx.root_cause)) or
+            (_may_match(ctx.execution_log, ctx.execution_log_lower, _VALID_TIMEOUT_TOKENS) and
+             _VALID_TIMEOUT_RE.search(ctx.execution_log))
+        )
+    return ctx.valid_timeout
+
 
 class CategoryRule:
     """Base class for category classification rules"""
@@ -18,13 +245,13 @@ class CategoryRule:
     priority: int = 0  # Higher = checked first
     category: str = "OTHER"
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
         """
         Check if this rule matches the failure.
         
         Args:
             failure: FailureClassification object
-            cache: TestDataCache for accessing execution logs
+            ctx: RuleContext with the failure's root cause and execution log
             
         Returns:
             True if rule matches, False otherwise
@@ -40,16 +267,11 @@ class ElementClickInterceptedRule(CategoryRule):
     priority = 12  # ELEMENT_NOT_FOUND priority (after TIMEOUT)
     category = 'ELEMENT_NOT_FOUND'
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
-        root_cause = failure.root_cause or ""
-        combined_text = f"{root_cause} {failure.recommended_action or ''}".lower()
-        execution_log = cache.get_combined_log(failure.test_name).lower()
-        
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
+        # The lowercased texts also contain every exact-case occurrence
         return (
-            "ElementClickInterceptedException" in root_cause or
-            "elementclickinterceptedexception" in combined_text or
-            "ElementClickInterceptedException" in cache.get_combined_log(failure.test_name) or
-            "elementclickinterceptedexception" in execution_log
+            "elementclickinterceptedexception" in ctx.combined_exceptions or
+            "elementclickinterceptedexception" in ctx.execution_log_exceptions
         )
 
 
@@ -58,44 +280,9 @@ class PageLoadTimeoutRule(CategoryRule):
     priority = 15  # Highest priority: Page Load Issues
     category = 'TIMEOUT'
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
-        root_cause = failure.root_cause or ""
-        execution_log = cache.get_combined_log(failure.test_name)
-        root_cause_lower = root_cause.lower()
-        execution_log_lower = execution_log.lower()
-        
-        # Pattern 1: "'PageName' NOT loaded even after :- X seconds"
-        is_page_load_timeout_pattern = (
-            # Pattern with single quotes: 'DashReviewPage' NOT loaded even after :- 40.071 seconds
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+NOT\s+loaded\s+even\s+after\s*[:-]\s*\d+\.?\d*\s+seconds", root_cause, re.IGNORECASE) or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+NOT\s+loaded\s+even\s+after\s*[:-]\s*\d+\.?\d*\s+seconds", execution_log, re.IGNORECASE) or
-            # Pattern with lowercase "not": 'PageName' not loaded even after
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+not\s+loaded\s+even\s+after", root_cause_lower) or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+not\s+loaded\s+even\s+after", execution_log_lower) or
-            # More flexible pattern: any page name followed by "NOT loaded" or "not loaded" with "even after"
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", root_cause, re.IGNORECASE) or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", execution_log, re.IGNORECASE)
-        )
-        
-        # Pattern 2: Element visibility timeout - "Element 'PageName:element' is NOT visible even after waiting for X seconds"
-        is_element_visibility_timeout = (
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", root_cause, re.IGNORECASE) or
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", execution_log, re.IGNORECASE) or
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+and\s+clickable\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", root_cause, re.IGNORECASE) or
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+and\s+clickable\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", execution_log, re.IGNORECASE)
-        )
-        
-        # Pattern 3: TimeoutException for element clickable/visible
-        is_timeout_exception_for_element = (
-            re.search(r"TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", root_cause, re.IGNORECASE) or
-            re.search(r"TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", execution_log, re.IGNORECASE) or
-            re.search(r"org\.openqa\.selenium\.TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", root_cause, re.IGNORECASE) or
-            re.search(r"org\.openqa\.selenium\.TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", execution_log, re.IGNORECASE) or
-            re.search(r"TimeoutException.*Expected\s+condition\s+failed.*waiting\s+for\s+element\s+to\s+be\s+clickable", root_cause, re.IGNORECASE) or
-            re.search(r"TimeoutException.*Expected\s+condition\s+failed.*waiting\s+for\s+element\s+to\s+be\s+clickable", execution_log, re.IGNORECASE)
-        )
-        
-        return bool(is_page_load_timeout_pattern or is_element_visibility_timeout or is_timeout_exception_for_element)
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
+        # Page load timeout, element visibility timeout or TimeoutException for element clickable/visible
+        return _has_valid_timeout(ctx)
 
 
 class ElementLocatorExceptionRule(CategoryRule):
@@ -103,42 +290,36 @@ class ElementLocatorExceptionRule(CategoryRule):
     priority = 11  # ELEMENT_NOT_FOUND priority (after TIMEOUT)
     category = 'ELEMENT_NOT_FOUND'
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
-        root_cause = failure.root_cause or ""
-        recommended_action = failure.recommended_action or ""
-        combined_text = f"{root_cause} {recommended_action}".lower()
-        execution_log = cache.get_combined_log(failure.test_name).lower()
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
+        combined_text = ctx.combined_text
+        execution_log = ctx.execution_log_lower
+        combined_exceptions = ctx.combined_exceptions
+        execution_log_exceptions = ctx.execution_log_exceptions
         
         is_element_locator_issue = (
-            "staleelementreferenceexception" in combined_text or
-            "staleelementreferenceexception" in execution_log or
-            ("nullpointerexception" in combined_text and (
+            "staleelementreferenceexception" in combined_exceptions or
+            "staleelementreferenceexception" in execution_log_exceptions or
+            ("nullpointerexception" in combined_exceptions and (
                 "webelement" in combined_text or 
                 "getpageelement" in combined_text or 
-                "gettext()" in combined_text or 
-                ".gettext()" in combined_text
+                "gettext()" in combined_text
             )) or
-            ("nullpointerexception" in execution_log and (
+            ("nullpointerexception" in execution_log_exceptions and (
                 "webelement" in execution_log or 
                 "getpageelement" in execution_log or 
-                "gettext()" in execution_log or 
-                ".gettext()" in execution_log
+                "gettext()" in execution_log
             )) or
-            ("indexoutofboundsexception" in combined_text and (
+            ("indexoutofboundsexception" in combined_exceptions and (
                 "length 0" in combined_text or 
-                "index 0" in combined_text or 
-                "out of bounds for length 0" in combined_text
+                "index 0" in combined_text
             )) or
-            ("indexoutofboundsexception" in execution_log and (
+            ("indexoutofboundsexception" in execution_log_exceptions and (
                 "length 0" in execution_log or 
-                "index 0" in execution_log or 
-                "out of bounds for length 0" in execution_log
+                "index 0" in execution_log
             )) or
             # StringIndexOutOfBoundsException should be categorized as ELEMENT_NOT_FOUND
-            "stringindexoutofboundsexception" in combined_text or
-            "stringindexoutofboundsexception" in execution_log or
-            "StringIndexOutOfBoundsException" in root_cause or
-            "StringIndexOutOfBoundsException" in cache.get_combined_log(failure.test_name)
+            "stringindexoutofboundsexception" in combined_exceptions or
+            "stringindexoutofboundsexception" in execution_log_exceptions
         )
         
         return bool(is_element_locator_issue)
@@ -149,16 +330,10 @@ class IllegalArgumentExceptionRule(CategoryRule):
     priority = 10  # ELEMENT_NOT_FOUND priority (after TIMEOUT)
     category = 'ELEMENT_NOT_FOUND'
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
-        root_cause = failure.root_cause or ""
-        combined_text = f"{root_cause} {failure.recommended_action or ''}".lower()
-        execution_log = cache.get_combined_log(failure.test_name).lower()
-        
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
         return (
-            "illegalargumentexception" in combined_text or
-            "illegalargumentexception" in execution_log or
-            "IllegalArgumentException" in root_cause or
-            "IllegalArgumentException" in cache.get_combined_log(failure.test_name)
+            "illegalargumentexception" in ctx.combined_exceptions or
+            "illegalargumentexception" in ctx.execution_log_exceptions
         )
 
 
@@ -167,37 +342,22 @@ class NonPageLoadTimeoutFilterRule(CategoryRule):
     priority = 6
     category = 'OTHER'
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
         # Only apply if current category is TIMEOUT
         current_category = getattr(failure, 'root_cause_category', 'OTHER')
         if current_category != 'TIMEOUT':
             return False
         
-        root_cause = failure.root_cause or ""
-        root_cause_lower = root_cause.lower()
-        execution_log = cache.get_combined_log(failure.test_name)
-        execution_log_lower = execution_log.lower()
+        root_cause_lower = ctx.root_cause_lower
         
         # Check if it's a valid timeout pattern (page load, element visibility, or element clickable timeout)
         is_valid_timeout = (
-            # Page load timeout patterns
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", root_cause, re.IGNORECASE) or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", execution_log, re.IGNORECASE) or
+            # Page load, element visibility and element clickable/visible TimeoutException patterns
+            _has_valid_timeout(ctx) or
+            # Looser page load timeout wording in the root cause
             "not loaded even after" in root_cause_lower or
             ("not loaded" in root_cause_lower and ("seconds" in root_cause_lower or "timeout" in root_cause_lower)) or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+not\s+loaded", root_cause_lower, re.IGNORECASE) or
-            # Element visibility timeout patterns
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", root_cause, re.IGNORECASE) or
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", execution_log, re.IGNORECASE) or
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+and\s+clickable\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", root_cause, re.IGNORECASE) or
-            re.search(r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible\s+and\s+clickable\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds", execution_log, re.IGNORECASE) or
-            # TimeoutException for element clickable/visible
-            re.search(r"TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", root_cause, re.IGNORECASE) or
-            re.search(r"TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", execution_log, re.IGNORECASE) or
-            re.search(r"org\.openqa\.selenium\.TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", root_cause, re.IGNORECASE) or
-            re.search(r"org\.openqa\.selenium\.TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible)", execution_log, re.IGNORECASE) or
-            re.search(r"TimeoutException.*Expected\s+condition\s+failed.*waiting\s+for\s+element\s+to\s+be\s+clickable", root_cause, re.IGNORECASE) or
-            re.search(r"TimeoutException.*Expected\s+condition\s+failed.*waiting\s+for\s+element\s+to\s+be\s+clickable", execution_log, re.IGNORECASE)
+            _PAGE_NOT_LOADED_SHORT_RE.search(root_cause_lower)
         )
         
         # If it's NOT a valid timeout pattern, move to OTHER
@@ -209,52 +369,45 @@ class AssertionFailureFilterRule(CategoryRule):
     priority = 5
     category = 'OTHER'
     
-    def matches(self, failure: FailureClassification, cache: TestDataCache) -> bool:
+    def matches(self, failure: FailureClassification, ctx: RuleContext) -> bool:
         # Only apply if current category is ASSERTION_FAILURE
         current_category = getattr(failure, 'root_cause_category', 'OTHER')
         if current_category != 'ASSERTION_FAILURE':
             return False
         
-        root_cause = failure.root_cause or ""
-        recommended_action = failure.recommended_action or ""
-        execution_log = cache.get_combined_log(failure.test_name)
+        root_cause = ctx.root_cause
+        execution_log = ctx.execution_log
         
-        assertion_text = f"{root_cause} {recommended_action} {execution_log}".lower()
+        assertion_text = f"{ctx.combined_text} {ctx.execution_log_lower}"
         
         # Check if it's clearly NOT an assertion
         is_clearly_not_assertion = (
-            "nosuchelementexception" in assertion_text or
-            "elementclickinterceptedexception" in assertion_text or
-            "staleelementreferenceexception" in assertion_text or
-            "timeoutexception" in assertion_text or
-            "webdriverexception" in assertion_text or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", root_cause, re.IGNORECASE) or
-            re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", execution_log, re.IGNORECASE) or
-            "not loaded even after" in assertion_text or
-            "not loaded even after" in execution_log.lower()
+            # NoSuchElement, ElementClickIntercepted, StaleElementReference, Timeout or WebDriver exception
+            not _NOT_ASSERTION_EXCEPTIONS.isdisjoint(ctx.combined_exceptions) or
+            not _NOT_ASSERTION_EXCEPTIONS.isdisjoint(ctx.execution_log_exceptions) or
+            # No character folds to "loaded" differently under lower() and re.IGNORECASE
+            ("loaded" in assertion_text and (
+                _PAGE_NOT_LOADED_RE.search(root_cause) or
+                _PAGE_NOT_LOADED_RE.search(execution_log)
+            )) or
+            "not loaded even after" in assertion_text
         )
         
         if is_clearly_not_assertion:
             return True
         
         # Check for valid assertion patterns
-        is_valid_assertion = (
-            # Pattern: "Expected 'X' was :-'Y'. But actual is 'Z'"
-            re.search(r"expected\s+['\"]?[^'\"]+['\"]?\s+was\s*[:-]\s*['\"]?[^'\"]+['\"]?\s*\.?\s*but\s+actual\s+is", assertion_text, re.IGNORECASE) or
-            # Pattern: "Expected 'X' but actual"
-            re.search(r"expected\s+[^.]*but\s+actual", assertion_text, re.IGNORECASE) or
-            # Pattern: "Classes of actual and expected key"
-            re.search(r"classes\s+of\s+actual\s+and\s+expected\s+key", assertion_text, re.IGNORECASE) or
-            # Pattern: "Missing Key:"
-            re.search(r"missing\s+(?:key|field)\s*:", assertion_text, re.IGNORECASE) or
-            # Pattern: "Actual JSON doesn't contain all expected keys"
-            re.search(r"actual\s+json\s+doesn'?t\s+contain\s+all\s+expected\s+keys", assertion_text, re.IGNORECASE) or
-            # Pattern: "Key/Value is null"
-            re.search(r"key\s*/\s*value\s+is\s+null", assertion_text, re.IGNORECASE) or
-            # Pattern: "The following asserts failed"
-            re.search(r"the\s+following\s+asserts\s+failed", assertion_text, re.IGNORECASE) or
+        # assertion_text is lowercased; only non-ASCII text still needs IGNORECASE ('ſ', 'ı', ...)
+        if assertion_text.isascii():
+            patterns = _ASSERTION_MESSAGE_PATTERNS_LOWER
+            expected_re, actual_re = _EXPECTED_WORD_LOWER_RE, _ACTUAL_WORD_LOWER_RE
+        else:
+            patterns = _ASSERTION_MESSAGE_PATTERNS
+            expected_re, actual_re = _EXPECTED_WORD_RE, _ACTUAL_WORD_RE
+        is_valid_assertion = _may_match(assertion_text, assertion_text, _ASSERTION_TOKENS) and (
+            _search_any(patterns, assertion_text) or
             # Pattern: Contains both "expected" and "actual" keywords
-            (re.search(r"\bexpected\b", assertion_text, re.IGNORECASE) and re.search(r"\bactual\b", assertion_text, re.IGNORECASE))
+            (expected_re.search(assertion_text) and actual_re.search(assertion_text))
         )
         
         # If it doesn't match any assertion patterns, move to OTHER
@@ -264,18 +417,27 @@ class AssertionFailureFilterRule(CategoryRule):
 class CategoryRuleEngine:
     """Engine to apply category classification rules"""
     
-    def __init__(self):
-        """Initialize with all rules, sorted by priority (highest first)"""
-        self.rules = [
-            ElementClickInterceptedRule(),
-            PageLoadTimeoutRule(),
-            ElementLocatorExceptionRule(),
-            IllegalArgumentExceptionRule(),
-            NonPageLoadTimeoutFilterRule(),
-            AssertionFailureFilterRule(),
-        ]
-        # Sort by priority (highest first)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+    def __init__(self, rules: Optional[Sequence[CategoryRule]] = None):
+        """
+        Initialize with the rules, sorted by priority (highest first).
+        
+        Args:
+            rules: Rules to apply (default: all rules in this module)
+        """
+        if rules is None:
+            rules = [
+                ElementClickInterceptedRule(),
+                PageLoadTimeoutRule(),
+                ElementLocatorExceptionRule(),
+                IllegalArgumentExceptionRule(),
+                NonPageLoadTimeoutFilterRule(),
+                AssertionFailureFilterRule(),
+            ]
+        # Sort by priority (highest first) - fixed from here on, the rule types key the classify() memo
+        self.rules = tuple(sorted(rules, key=lambda r: r.priority, reverse=True))
+        self._rule_types = tuple(type(rule) for rule in self.rules)
+        # Each rule with its category's priority, looked up once here instead of on every match
+        self._ranked_rules = tuple((rule, _CATEGORY_PRIORITY.get(rule.category, 0)) for rule in self.rules)
     
     def classify(self, failure: FailureClassification, cache: TestDataCache) -> str:
         """
@@ -288,6 +450,81 @@ class CategoryRuleEngine:
         Returns:
             Category string (e.g., 'ELEMENT_NOT_FOUND', 'TIMEOUT', 'ASSERTION_FAILURE', 'OTHER')
         """
+        execution_log = cache.get_combined_log(failure.test_name)
+        cache_key = self._cache_key(failure, execution_log)
+        category = _CLASSIFY_CACHE.get(cache_key)
+        if category is not None:
+            return category
+        
+        # Root cause and execution log are fetched and lowercased once for all rules
+        ctx = RuleContext.from_log(failure, execution_log, cache.get_combined_log_lower(failure.test_name))
+        category = self._classify_context(failure, ctx)
+        _remember_category(cache_key, category)
+        return category
+    
+    def classify_all(self, failures: Sequence[FailureClassification], cache: TestDataCache,
+                     workers: Optional[int] = None) -> List[str]:
+        """
+        Classify many failures, optionally in parallel worker processes.
+        A memoised classification costs tens of microseconds, less than spawning a worker and
+        shipping it the logs, so the pool is only used when workers is passed explicitly.
+        
+        Args:
+            failures: FailureClassification objects
+            cache: TestDataCache for accessing execution logs
+            workers: Number of worker processes (default: classify in this process)
+            
+        Returns:
+            Category strings, in the same order as failures
+        """
+        if workers is None or workers < 2:
+            return [self.classify(failure, cache) for failure in failures]
+        
+        # Only memo misses are shipped, once per distinct key - the cache itself stays in this process.
+        # Memo hits are copied out now: storing the new categories below can evict them
+        logs = [cache.get_combined_log(failure.test_name) for failure in failures]
+        keys = [self._cache_key(failure, execution_log) for failure, execution_log in zip(failures, logs)]
+        categories = {}
+        pending = {}
+        for failure, execution_log, key in zip(failures, logs, keys):
+            if key in categories or key in pending:
+                continue
+            category = _CLASSIFY_CACHE.get(key)
+            if category is not None:
+                categories[key] = category
+            else:
+                pending[key] = (failure, execution_log)
+        
+        classified = {}
+        max_workers = min(workers, len(pending))
+        if max_workers < 2:
+            for key, (failure, execution_log) in pending.items():
+                classified[key] = self._classify_context(failure, RuleContext.from_log(failure, execution_log))
+        else:
+            items = list(pending.values())
+            chunk_size = -(-len(items) // (max_workers * 4))
+            chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=SPAWN_CONTEXT) as executor:
+                results = executor.map(_classify_chunk, repeat(self._rule_types), chunks)
+                classified = dict(zip(pending, (category for chunk in results for category in chunk)))
+        
+        for key, category in classified.items():
+            _remember_category(key, category)
+        categories.update(classified)
+        return [categories[key] for key in keys]
+    
+    def _cache_key(self, failure: FailureClassification, execution_log: str) -> tuple:
+        """Memo key for a failure - a 128-bit digest stands in for the log, which can be many KB"""
+        return (
+            self._rule_types,
+            failure.root_cause,
+            failure.recommended_action,
+            getattr(failure, 'root_cause_category', 'OTHER'),
+            hashlib.blake2b(execution_log.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        )
+    
+    def _classify_context(self, failure: FailureClassification, ctx: RuleContext) -> str:
+        """Apply the rules to a failure whose RuleContext is already built"""
         # Start with the AI's initial classification
         category = getattr(failure, 'root_cause_category', 'OTHER')
         
@@ -295,33 +532,42 @@ class CategoryRuleEngine:
         if category == 'NETWORK_ISSUE' or category == 'ENVIRONMENT_FAILURE':
             category = 'ENVIRONMENT_ISSUE'
         
-        # Define category priority mapping (higher number = higher priority)
-        # Order: TIMEOUT > ELEMENT_NOT_FOUND > ASSERTION_FAILURE > ENVIRONMENT_ISSUE > OTHER
-        category_priority = {
-            'TIMEOUT': 15,
-            'ELEMENT_NOT_FOUND': 12,
-            'ASSERTION_FAILURE': 8,
-            'ENVIRONMENT_ISSUE': 6,
-            'OTHER': 1
-        }
-        
-        # Find all matching rules (instead of breaking on first match)
+        # Keep the matching rule with the highest priority category (instead of breaking on first match)
         # This ensures we select the highest priority category when multiple failures exist
-        matching_rules = []
-        for rule in self.rules:
-            if rule.matches(failure, cache):
-                matching_rules.append(rule)
-                logger.debug(f"Rule {rule.__class__.__name__} matched for {failure.test_name}: {rule.category}")
+        # Rules are sorted by rule priority, so on a category tie the first match wins
+        best_rule = None
+        best_priority = 0
+        for rule, rule_priority in self._ranked_rules:
+            if rule.matches(failure, ctx):
+                logger.debug("Rule %s matched for %s: %s", rule.__class__.__name__, failure.test_name, rule.category)
+                if best_rule is None or rule_priority > best_priority:
+                    best_rule = rule
+                    best_priority = rule_priority
+                if best_priority == _TOP_CATEGORY_PRIORITY:
+                    # No later rule can produce a higher priority category
+                    break
         
-        # If multiple rules match, select the one with highest priority category
-        if matching_rules:
-            # Sort by category priority (highest first), then by rule priority
-            matching_rules.sort(key=lambda r: (
-                category_priority.get(r.category, 0),
-                r.priority
-            ), reverse=True)
-            category = matching_rules[0].category
-            logger.debug(f"Selected highest priority category for {failure.test_name}: {category} (from {len(matching_rules)} matching rules)")
+        if best_rule is not None:
+            category = best_rule.category
+            logger.debug("Selected highest priority category for %s: %s", failure.test_name, category)
         
         return category
 
+
+def clear_classify_cache() -> None:
+    """Forget every memoised classification (e.g. between tests)"""
+    _CLASSIFY_CACHE.clear()
+
+
+def _remember_category(cache_key: tuple, category: str) -> None:
+    """Store a classification in the memo, evicting the oldest entry once it is full"""
+    _CLASSIFY_CACHE[cache_key] = category
+    if len(_CLASSIFY_CACHE) > _CLASSIFY_CACHE_MAX_ENTRIES:
+        _CLASSIFY_CACHE.pop(next(iter(_CLASSIFY_CACHE)), None)
+
+
+def _classify_chunk(rule_types: Tuple[type, ...], items: List[Tuple[FailureClassification, str]]) -> List[str]:
+    """Worker for classify_all - module-level so it can be pickled into a worker process"""
+    engine = CategoryRuleEngine([rule_type() for rule_type in rule_types])
+    return [engine._classify_context(failure, RuleContext.from_log(failure, execution_log))
+            for failure, execution_log in items]
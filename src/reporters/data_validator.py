@@ -3,7 +3,12 @@ Data validation layer for report generation.
 Validates data consistency and logs warnings about potential issues.
 """
 
+import re
+import sys
 import logging
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from itertools import chain, islice
 from typing import List, Dict, Optional
 from ..parsers.models import TestResult
 from ..agent.analyzer import FailureClassification
@@ -11,6 +16,81 @@ from ..utils import TestDataCache, TestNameNormalizer
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses drop the per-instance __dict__; slots=True needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Representative signal patterns (matching report_generator.py), compiled once for every failure checked
+# TIMEOUT, in priority order: element visibility, page load, bare page name, TimeoutException
+_ELEMENT_TIMEOUT_RE = re.compile(
+    r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible(?:\s+and\s+clickable)?\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds",
+    re.IGNORECASE
+)
+# The quoted run is checked for "Page" with a lookahead before it is consumed, so it is not
+# backtracked over once per "Page" in it. A bare page name match can only start where its word
+# does, so \b stops \w+ from being retried at every character inside each word. Same captures.
+_PAGE_TIMEOUT_RE = re.compile(r"['\"](?=[^'\"]+?Page)([^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", re.IGNORECASE)
+_ALT_PAGE_RE = re.compile(r"\b(\w+Page\w*)\s+(?:NOT|not)\s+loaded\s+even\s+after", re.IGNORECASE)
+_TIMEOUT_EXC_RE = re.compile(
+    r"TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible).*?['\"]([^'\"]+)['\"]",
+    re.IGNORECASE | re.DOTALL
+)
+# ELEMENT_NOT_FOUND: exception name, and the method a NullPointerException was raised in.
+# As with the bare page name, the leftmost exception name always starts at its word, so \b
+# keeps \w+ from being retried at every character of every word in the log. Same captures.
+_EXCEPTION_RE = re.compile(r'\b(\w+Exception)(?::|$|\s)', re.IGNORECASE)
+_NPE_CONTEXT_RE = re.compile(r'Cannot invoke\s+"[^"]*\.(\w+)\(\)"', re.IGNORECASE)
+# ASSERTION_FAILURE key mismatches as one alternation, the group that matched naming the signal.
+# None of these matches can contain another, so one finditer pass sees every one of them
+_ASSERTION_KEYS_RE = re.compile(
+    r"(?P<api_keys>missing\s+key\s*:|actual\s+json\s+doesn'?t\s+contain\s+all\s+expected\s+keys)"
+    r"|(?P<keys_format>classes\s+of\s+actual\s+and\s+expected\s+key|key\s*/\s*value\s+is\s+null)",
+    re.IGNORECASE
+)
+_ASSERTION_KEYS_SIGNALS = {
+    'api_keys': "API Keys mismatch",
+    'keys_format': "Keys formatting mismatch",
+}
+_SINGLE_TEXT_RE = re.compile(
+    r"expected\s+['\"]?[^'\"]+['\"]?\s+was\s*[:-]\s*['\"]?[^'\"]+['\"]?\s*\.?\s*but\s+actual\s+is",
+    re.IGNORECASE
+)
+# Case-sensitive twins for the lowercased search text when it is ASCII, where they match exactly
+# the same spans. Non-ASCII text keeps IGNORECASE, which also folds characters lower() leaves alone
+_ASSERTION_KEYS_LOWER_RE = re.compile(_ASSERTION_KEYS_RE.pattern)
+_SINGLE_TEXT_LOWER_RE = re.compile(_SINGLE_TEXT_RE.pattern)
+
+
+@dataclass(**_SLOTS)
+class ValidationStats:
+    """Statistics and messages collected by DataValidator"""
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    test_name_normalization_issues: int = 0
+    missing_execution_logs: int = 0
+    missing_html_links: int = 0
+    classification_mismatches: int = 0
+    duplicate_tests: int = 0
+    
+    def to_dict(self) -> Dict[str, any]:
+        """Get the statistics as a dictionary keyed by field name"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(**_SLOTS)
+class PostReportStats:
+    """Statistics and messages collected by PostReportValidator"""
+    warnings: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    tests_without_links: int = 0
+    count_inconsistencies: int = 0
+    duplicate_tests_in_category: int = 0
+    category_sum_mismatch: bool = False
+    representative_signals_mismatch: int = 0
+    
+    def to_dict(self) -> Dict[str, any]:
+        """Get the statistics as a dictionary keyed by field name"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class DataValidator:
     """Validates data consistency before report generation"""
@@ -32,6 +112,8 @@ class DataValidator:
         self.html_links = html_links or {}
         self.warnings = []
         self.errors = []
+        # Normalized name -> test result, so matching a classification is a lookup instead of a scan
+        self._results_by_name = TestNameNormalizer.index_tests(test_results)
     
     def validate_all(self) -> Dict[str, any]:
         """
@@ -42,116 +124,88 @@ class DataValidator:
         """
         logger.info("🔍 Starting data validation...")
         
-        stats = {
-            'warnings': [],
-            'errors': [],
-            'test_name_normalization_issues': 0,
-            'missing_execution_logs': 0,
-            'missing_html_links': 0,
-            'classification_mismatches': 0,
-            'duplicate_tests': 0,
-        }
+        stats = ValidationStats()
         
         # Run all validations
-        self._validate_test_name_normalization(stats)
-        self._validate_execution_logs(stats)
-        self._validate_html_links(stats)
-        self._validate_classification_matching(stats)
-        self._validate_duplicates(stats)
+        self._validate_classifications(stats)
         
         # Log summary
-        if stats['warnings']:
-            logger.warning(f"⚠️ Data validation found {len(stats['warnings'])} warnings")
-            for warning in stats['warnings'][:10]:  # Log first 10
+        if stats.warnings:
+            logger.warning(f"⚠️ Data validation found {len(stats.warnings)} warnings")
+            for warning in stats.warnings[:10]:  # Log first 10
                 logger.warning(f"  - {warning}")
         else:
             logger.info("✅ Data validation passed with no warnings")
         
-        if stats['errors']:
-            logger.error(f"❌ Data validation found {len(stats['errors'])} errors")
-            for error in stats['errors'][:10]:  # Log first 10
+        if stats.errors:
+            logger.error(f"❌ Data validation found {len(stats.errors)} errors")
+            for error in stats.errors[:10]:  # Log first 10
                 logger.error(f"  - {error}")
         
-        return stats
+        return stats.to_dict()
     
-    def _validate_test_name_normalization(self, stats: Dict):
-        """Validate that test names are normalized consistently"""
+    def _validate_classifications(self, stats: ValidationStats):
+        """
+        Validate test name normalization, execution logs, HTML links, classification matching and
+        duplicates in one pass over the classifications. Stats and warnings are filled in that order.
+        """
+        # Test results that normalize to the same name
+        name_issues = []
         normalized_names = set()
-        issues = []
-        
         for result in self.test_results:
-            normalized = TestNameNormalizer.normalize(result.full_name)
+            normalized = result.normalized_name
             if normalized in normalized_names:
-                issues.append(f"Duplicate normalized name: {normalized}")
+                name_issues.append(f"Duplicate normalized name: {normalized}")
             normalized_names.add(normalized)
         
-        for classification in self.classifications:
-            normalized = TestNameNormalizer.normalize(classification.test_name)
-            if normalized not in normalized_names:
-                # Check if it matches any test result
-                matching = TestNameNormalizer.find_matching_test(classification.test_name, self.test_results)
-                if not matching:
-                    issues.append(f"Classification test name '{classification.test_name}' doesn't match any test result")
-        
-        stats['test_name_normalization_issues'] = len(issues)
-        if issues:
-            stats['warnings'].extend(issues[:5])  # Limit warnings
-    
-    def _validate_execution_logs(self, stats: Dict):
-        """Validate that execution logs are available for failures"""
+        unmatched = []
         missing_logs = []
-        
-        for classification in self.classifications:
-            log = self.cache.get_combined_log(classification.test_name)
-            if not log or not log.strip():
-                missing_logs.append(f"No execution log for: {classification.test_name}")
-        
-        stats['missing_execution_logs'] = len(missing_logs)
-        if missing_logs:
-            stats['warnings'].extend([f"Missing execution logs: {len(missing_logs)} tests"] + missing_logs[:3])
-    
-    def _validate_html_links(self, stats: Dict):
-        """Validate that HTML links are available for tests"""
         missing_links = []
-        
+        name_counts = Counter()
+        test_names = [classification.test_name for classification in self.classifications]
+        logs = self.cache.get_combined_logs_bulk(test_names)
+        links = self.cache.get_html_links_bulk(test_names)
         for classification in self.classifications:
-            link = self.cache.get_html_link(classification.test_name)
-            if not link:
-                missing_links.append(f"No HTML link for: {classification.test_name}")
-        
-        stats['missing_html_links'] = len(missing_links)
-        if missing_links:
-            stats['warnings'].extend([f"Missing HTML links: {len(missing_links)} tests"] + missing_links[:3])
-    
-    def _validate_classification_matching(self, stats: Dict):
-        """Validate that classifications match test results"""
-        mismatches = []
+            test_name = classification.test_name
+            normalized = classification.normalized_name
+            name_counts[normalized] += 1
+            if normalized not in self._results_by_name:
+                unmatched.append(test_name)
+            
+            log = logs[test_name]
+            # isspace() stops at the first non-blank character, where strip() would copy the whole log
+            if not log or log.isspace():
+                missing_logs.append(test_name)
+            
+            if not links[test_name]:
+                missing_links.append(test_name)
         
-        for classification in self.classifications:
-            matching_test = TestNameNormalizer.find_matching_test(classification.test_name, self.test_results)
-            if not matching_test:
-                mismatches.append(f"Classification '{classification.test_name}' has no matching test result")
+        # Only the messages that make it into the (limited) warnings are formatted
+        stats.test_name_normalization_issues = len(name_issues) + len(unmatched)
+        stats.warnings.extend(islice(chain(name_issues, (
+            f"Classification test name '{test_name}' doesn't match any test result" for test_name in unmatched
+        )), 5))
         
-        stats['classification_mismatches'] = len(mismatches)
-        if mismatches:
-            stats['warnings'].extend(mismatches[:5])
-    
-    def _validate_duplicates(self, stats: Dict):
-        """Validate that there are no duplicate tests in classifications"""
-        seen = {}
-        duplicates = []
-        
-        for classification in self.classifications:
-            normalized = TestNameNormalizer.normalize(classification.test_name)
-            if normalized in seen:
-                duplicates.append(f"Duplicate classification: {normalized} (seen {seen[normalized]} times)")
-                seen[normalized] = seen.get(normalized, 1) + 1
-            else:
-                seen[normalized] = 1
+        stats.missing_execution_logs = len(missing_logs)
+        if missing_logs:
+            stats.warnings.append(f"Missing execution logs: {len(missing_logs)} tests")
+            stats.warnings.extend(f"No execution log for: {test_name}" for test_name in islice(missing_logs, 3))
         
-        stats['duplicate_tests'] = len(duplicates)
-        if duplicates:
-            stats['warnings'].extend(duplicates[:5])
+        stats.missing_html_links = len(missing_links)
+        if missing_links:
+            stats.warnings.append(f"Missing HTML links: {len(missing_links)} tests")
+            stats.warnings.extend(f"No HTML link for: {test_name}" for test_name in islice(missing_links, 3))
+        
+        stats.classification_mismatches = len(unmatched)
+        stats.warnings.extend(
+            f"Classification '{test_name}' has no matching test result" for test_name in islice(unmatched, 5)
+        )
+        
+        duplicates = [(normalized, count) for normalized, count in name_counts.items() if count > 1]
+        stats.duplicate_tests = len(duplicates)
+        stats.warnings.extend(
+            f"Duplicate classification: {normalized} (seen {count} times)" for normalized, count in islice(duplicates, 5)
+        )
 
 
 def validate_report_data(test_results: List[TestResult], classifications: List[FailureClassification],
@@ -202,15 +256,7 @@ class PostReportValidator:
         """
         logger.info("🔍 Starting post-report validation...")
         
-        stats = {
-            'warnings': [],
-            'errors': [],
-            'tests_without_links': 0,
-            'count_inconsistencies': 0,
-            'duplicate_tests_in_category': 0,
-            'category_sum_mismatch': False,
-            'representative_signals_mismatch': 0,
-        }
+        stats = PostReportStats()
         
         # Run all validations
         self._validate_category_links(stats)
@@ -220,38 +266,38 @@ class PostReportValidator:
         self._validate_representative_signals_counts(stats)
         
         # Log summary
-        if stats['warnings']:
-            logger.warning(f"⚠️ Post-report validation found {len(stats['warnings'])} warnings")
-            for warning in stats['warnings'][:10]:  # Log first 10
+        if stats.warnings:
+            logger.warning(f"⚠️ Post-report validation found {len(stats.warnings)} warnings")
+            for warning in stats.warnings[:10]:  # Log first 10
                 logger.warning(f"  - {warning}")
         else:
             logger.info("✅ Post-report validation passed with no warnings")
         
-        if stats['errors']:
-            logger.error(f"❌ Post-report validation found {len(stats['errors'])} errors")
-            for error in stats['errors'][:10]:  # Log first 10
+        if stats.errors:
+            logger.error(f"❌ Post-report validation found {len(stats.errors)} errors")
+            for error in stats.errors[:10]:  # Log first 10
                 logger.error(f"  - {error}")
         
-        return stats
+        return stats.to_dict()
     
-    def _validate_category_links(self, stats: Dict):
+    def _validate_category_links(self, stats: PostReportStats):
         """Validate that all tests in categories have valid HTML links"""
         tests_without_links = []
         
+        links = self.cache.get_html_links_bulk(
+            failure.test_name for failures in self.category_failures.values() for failure in failures
+        )
         for category, failures in self.category_failures.items():
             for failure in failures:
-                link = self.cache.get_html_link(failure.test_name)
-                if not link:
-                    tests_without_links.append(f"{category}: {failure.test_name}")
+                if not links[failure.test_name]:
+                    tests_without_links.append((category, failure.test_name))
         
-        stats['tests_without_links'] = len(tests_without_links)
+        stats.tests_without_links = len(tests_without_links)
         if tests_without_links:
-            stats['warnings'].extend([
-                f"Tests without HTML links: {len(tests_without_links)}",
-                *tests_without_links[:5]
-            ])
+            stats.warnings.append(f"Tests without HTML links: {len(tests_without_links)}")
+            stats.warnings.extend(f"{category}: {test_name}" for category, test_name in islice(tests_without_links, 5))
     
-    def _validate_category_counts(self, stats: Dict):
+    def _validate_category_counts(self, stats: PostReportStats):
         """Validate that counts are consistent across sections"""
         inconsistencies = []
         
@@ -262,27 +308,28 @@ class PostReportValidator:
                     f"Category '{category}': count mismatch - expected {expected_count}, actual {actual_count}"
                 )
         
-        stats['count_inconsistencies'] = len(inconsistencies)
+        stats.count_inconsistencies = len(inconsistencies)
         if inconsistencies:
-            stats['errors'].extend(inconsistencies)
+            stats.errors.extend(inconsistencies)
     
-    def _validate_no_duplicates_in_categories(self, stats: Dict):
+    def _validate_no_duplicates_in_categories(self, stats: PostReportStats):
         """Validate that there are no duplicate tests in the same category"""
         duplicates = []
         
         for category, failures in self.category_failures.items():
             seen = set()
             for failure in failures:
-                normalized = TestNameNormalizer.normalize(failure.test_name)
+                normalized = failure.normalized_name
                 if normalized in seen:
-                    duplicates.append(f"Category '{category}': duplicate test '{failure.test_name}'")
+                    duplicates.append((category, failure.test_name))
                 seen.add(normalized)
         
-        stats['duplicate_tests_in_category'] = len(duplicates)
-        if duplicates:
-            stats['errors'].extend(duplicates[:5])
+        stats.duplicate_tests_in_category = len(duplicates)
+        stats.errors.extend(
+            f"Category '{category}': duplicate test '{test_name}'" for category, test_name in islice(duplicates, 5)
+        )
     
-    def _validate_category_sum(self, stats: Dict):
+    def _validate_category_sum(self, stats: PostReportStats):
         """Validate that all categories sum to total failures"""
         category_sum = sum(self.category_counts.values())
         
@@ -291,20 +338,18 @@ class PostReportValidator:
                 f"Category sum mismatch: categories sum to {category_sum}, "
                 f"but total failures is {self.total_failures}"
             )
-            stats['category_sum_mismatch'] = True
-            stats['errors'].append(error_msg)
+            stats.category_sum_mismatch = True
+            stats.errors.append(error_msg)
     
-    def _validate_representative_signals_counts(self, stats: Dict):
+    def _validate_representative_signals_counts(self, stats: PostReportStats):
         """Validate that representative signals counts match test counts"""
-        import re
-        
         mismatches = []
         
         for category, failures in self.category_failures.items():
             if category == 'TIMEOUT':
                 # Extract element patterns and page counts from representative signals logic (matching report_generator.py)
-                element_patterns = {}
-                page_counts = {}
+                element_patterns = Counter()
+                page_counts = Counter()
                 matched_count = 0
                 
                 for failure in failures:
@@ -312,42 +357,46 @@ class PostReportValidator:
                     exec_log = self.cache.get_combined_log(failure.test_name)
                     search_text = f"{root_cause} {exec_log}"
                     matched = False
+                    # Each pattern is only run when the lowercased log or root cause contains a word it
+                    # needs. None of these words has an i or s, the only letters some character folds to
+                    # differently under lower() and re.IGNORECASE; the lowercased log is cached per test
+                    exec_log_lower = self.cache.get_combined_log_lower(failure.test_name)
+                    root_cause_lower = root_cause.lower()
+                    may_be_element_timeout = "after" in exec_log_lower or "after" in root_cause_lower
+                    may_be_page_load = "loaded" in exec_log_lower or "loaded" in root_cause_lower
+                    may_be_timeout_exception = (
+                        "meoutexcept" in exec_log_lower or "meoutexcept" in root_cause_lower
+                    )
                     
                     # Priority 1: Extract element visibility timeout patterns
-                    element_match = re.search(
-                        r"Element\s+['\"]([^'\"]+)['\"]\s+is\s+(?:NOT|not)\s+visible(?:\s+and\s+clickable)?\s+even\s+after\s+waiting\s+for\s+\d+\s+seconds",
-                        search_text,
-                        re.IGNORECASE
-                    )
+                    element_match = may_be_element_timeout and _ELEMENT_TIMEOUT_RE.search(search_text)
                     if element_match:
                         element_pattern = element_match.group(1).strip()
-                        element_patterns[element_pattern] = element_patterns.get(element_pattern, 0) + 1
+                        element_patterns[element_pattern] += 1
                         matched = True
                     else:
                         # Priority 2: Extract page load timeout patterns
-                        page_match = re.search(r"['\"]([^'\"]+Page[^'\"]*)['\"]\s+(?:NOT|not)\s+loaded\s+even\s+after", search_text, re.IGNORECASE)
+                        page_match = may_be_page_load and _PAGE_TIMEOUT_RE.search(search_text)
                         if page_match:
                             page_name = page_match.group(1)
-                            page_counts[page_name] = page_counts.get(page_name, 0) + 1
+                            page_counts[page_name] += 1
                             matched = True
                         else:
                             # Priority 3: Try alternative pattern
-                            alt_match = re.search(r"(\w+Page\w*)\s+(?:NOT|not)\s+loaded\s+even\s+after", search_text, re.IGNORECASE)
+                            alt_match = may_be_page_load and _ALT_PAGE_RE.search(search_text)
                             if alt_match:
                                 page_name = alt_match.group(1)
-                                page_counts[page_name] = page_counts.get(page_name, 0) + 1
+                                page_counts[page_name] += 1
                                 matched = True
                             else:
                                 # Priority 4: Try TimeoutException patterns
-                                timeout_exception_match = re.search(
-                                    r"TimeoutException.*waiting\s+for\s+element\s+to\s+be\s+(?:clickable|visible).*?['\"]([^'\"]+)['\"]",
-                                    search_text,
-                                    re.IGNORECASE | re.DOTALL
+                                timeout_exception_match = (
+                                    may_be_timeout_exception and _TIMEOUT_EXC_RE.search(search_text)
                                 )
                                 if timeout_exception_match:
                                     element_desc = timeout_exception_match.group(1).strip()
                                     if element_desc:
-                                        element_patterns[element_desc] = element_patterns.get(element_desc, 0) + 1
+                                        element_patterns[element_desc] += 1
                                         matched = True
                     
                     if matched:
@@ -363,18 +412,23 @@ class PostReportValidator:
             
             elif category == 'ELEMENT_NOT_FOUND':
                 # Extract exception counts
-                exception_counts = {}
+                exception_counts = Counter()
                 for failure in failures:
                     root_cause = failure.root_cause or ""
                     exec_log = self.cache.get_combined_log(failure.test_name)
                     search_text = f"{root_cause} {exec_log}"
                     
-                    exception_match = re.search(r'(\w+Exception)(?::|$|\s)', search_text, re.IGNORECASE)
+                    # Every exception name contains "xcept", checked on the cached lowercased log as above
+                    may_name_exception = (
+                        "xcept" in self.cache.get_combined_log_lower(failure.test_name) or
+                        "xcept" in root_cause.lower()
+                    )
+                    exception_match = may_name_exception and _EXCEPTION_RE.search(search_text)
                     if exception_match:
                         exception_type = exception_match.group(1)
                         # Try to get context for NullPointerException
                         if exception_type.lower() == 'nullpointerexception':
-                            context_match = re.search(r'Cannot invoke\s+"[^"]*\.(\w+)\(\)"', search_text, re.IGNORECASE)
+                            context_match = _NPE_CONTEXT_RE.search(search_text)
                             if context_match:
                                 context = context_match.group(1)
                                 key = f"{exception_type} in {context}"
@@ -382,9 +436,9 @@ class PostReportValidator:
                                 key = exception_type
                         else:
                             key = exception_type
-                        exception_counts[key] = exception_counts.get(key, 0) + 1
+                        exception_counts[key] += 1
                     else:
-                        exception_counts["Unknown exception"] = exception_counts.get("Unknown exception", 0) + 1
+                        exception_counts["Unknown exception"] += 1
                 
                 signal_sum = sum(exception_counts.values())
                 if signal_sum != len(failures):
@@ -395,25 +449,31 @@ class PostReportValidator:
             
             elif category == 'ASSERTION_FAILURE':
                 # Extract assertion category counts
-                assertion_categories = {}
+                assertion_categories = Counter()
                 for failure in failures:
                     root_cause = failure.root_cause or ""
-                    exec_log = self.cache.get_combined_log(failure.test_name)
-                    search_text = f"{root_cause} {exec_log}".lower()
+                    # Same as lowercasing the joined text; the lowercased log is cached per test
+                    exec_log_lower = self.cache.get_combined_log_lower(failure.test_name)
+                    search_text = f"{root_cause.lower()} {exec_log_lower}"
                     
-                    category_type = None
-                    if re.search(r"missing\s+key\s*:", search_text, re.IGNORECASE) or \
-                       re.search(r"actual\s+json\s+doesn'?t\s+contain\s+all\s+expected\s+keys", search_text, re.IGNORECASE):
-                        category_type = "API Keys mismatch"
-                    elif re.search(r"classes\s+of\s+actual\s+and\s+expected\s+key", search_text, re.IGNORECASE) or \
-                         re.search(r"key\s*/\s*value\s+is\s+null", search_text, re.IGNORECASE):
-                        category_type = "Keys formatting mismatch"
-                    elif re.search(r"expected\s+['\"]?[^'\"]+['\"]?\s+was\s*[:-]\s*['\"]?[^'\"]+['\"]?\s*\.?\s*but\s+actual\s+is", search_text, re.IGNORECASE):
-                        category_type = "Single text not matching"
+                    if search_text.isascii():
+                        keys_re, single_text_re = _ASSERTION_KEYS_LOWER_RE, _SINGLE_TEXT_LOWER_RE
                     else:
-                        category_type = "Assertion failure"
+                        keys_re, single_text_re = _ASSERTION_KEYS_RE, _SINGLE_TEXT_RE
+                    
+                    # API keys mismatch wins wherever it occurs, then keys formatting, then single text
+                    category_type = None
+                    for match in keys_re.finditer(search_text):
+                        category_type = _ASSERTION_KEYS_SIGNALS[match.lastgroup]
+                        if match.lastgroup == 'api_keys':
+                            break
+                    if category_type is None:
+                        if single_text_re.search(search_text):
+                            category_type = "Single text not matching"
+                        else:
+                            category_type = "Assertion failure"
                     
-                    assertion_categories[category_type] = assertion_categories.get(category_type, 0) + 1
+                    assertion_categories[category_type] += 1
                 
                 signal_sum = sum(assertion_categories.values())
                 if signal_sum != len(failures):
@@ -422,9 +482,9 @@ class PostReportValidator:
                         f"doesn't match test count ({len(failures)})"
                     )
         
-        stats['representative_signals_mismatch'] = len(mismatches)
+        stats.representative_signals_mismatch = len(mismatches)
         if mismatches:
-            stats['warnings'].extend(mismatches)
+            stats.warnings.extend(mismatches)
 
 
 def validate_post_report(category_counts: Dict[str, int], 
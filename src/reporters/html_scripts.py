@@ -3,32 +3,11 @@ JavaScript code for HTML report generation.
 Extracted from report_generator.py for better maintainability.
 """
 
-
-def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str) -> str:
-    """
-    Generate JavaScript code for the HTML report.
-    
-    Args:
-        dashboard_base_url: Base URL for the dashboard (e.g., "https://dashboard.qa.example.com")
-        project_name: Project name for building URLs
-        
-    Returns:
-        JavaScript code as a string
-    """
-    # Escape single quotes in the values to prevent JavaScript errors
-    dashboard_base_url_escaped = dashboard_base_url.replace("'", "\\'")
-    project_name_escaped = project_name.replace("'", "\\'")
-    job_name_escaped = (job_name or "").replace("'", "\\'")
-    
-    # Use triple quotes with string concatenation to avoid issues with JavaScript braces
-    return (
-        """            // Configuration from server
-            const DASHBOARD_BASE_URL = '""" + dashboard_base_url_escaped + """';
-            const PROJECT_NAME = '""" + project_name_escaped + """';
-            const JOB_NAME = '""" + job_name_escaped + """';
-            const newlineChar = '\\n';
+# Everything after the configuration constants is static, so it is built once at import
+_SCRIPTS_BODY = """            const newlineChar = '\\n';
             
-            // Handle expand icon click to toggle details and update animation
+            // Handle expand icon click to toggle details and update animation. Clicks on a details
+            // summary need no handler: the details toggle natively and the toggle listener syncs the icon
             document.addEventListener('click', function(event) {
                 if (event.target.classList.contains('test-expand-icon')) {
                     event.preventDefault();
@@ -51,46 +30,23 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                 }
             });
             
-            // Also handle clicks on the details summary to sync icon animation
-            document.addEventListener('click', function(event) {
-                const summary = event.target.closest('.test-details-summary');
-                if (summary) {
-                    const details = summary.closest('.test-details-expandable');
-                    if (details) {
-                        const chipContainer = details.closest('.test-chip-with-details');
-                        if (chipContainer) {
-                            const icon = chipContainer.querySelector('.test-expand-icon');
-                            if (icon) {
-                                // Small delay to sync with details open state
-                                setTimeout(function() {
-                                    if (details.open) {
-                                        icon.classList.add('expanded');
-                                    } else {
-                                        icon.classList.remove('expanded');
-                                    }
-                                }, 10);
-                            }
+            // Watch for details open/close changes to sync icon animation. toggle does not bubble, so a
+            // single capturing listener on document sees it for every details element
+            document.addEventListener('toggle', function(event) {
+                const details = event.target;
+                if (!details.classList.contains('test-details-expandable')) return;
+                const chipContainer = details.closest('.test-chip-with-details');
+                if (chipContainer) {
+                    const icon = chipContainer.querySelector('.test-expand-icon');
+                    if (icon) {
+                        if (details.open) {
+                            icon.classList.add('expanded');
+                        } else {
+                            icon.classList.remove('expanded');
                         }
                     }
                 }
-            });
-            
-            // Watch for details open/close changes to sync icon animation
-            document.querySelectorAll('.test-details-expandable').forEach(function(details) {
-                details.addEventListener('toggle', function() {
-                    const chipContainer = details.closest('.test-chip-with-details');
-                    if (chipContainer) {
-                        const icon = chipContainer.querySelector('.test-expand-icon');
-                        if (icon) {
-                            if (details.open) {
-                                icon.classList.add('expanded');
-                            } else {
-                                icon.classList.remove('expanded');
-                            }
-                        }
-                    }
-                });
-            });
+            }, true);
             
             // Close test details expandable section
             function closeTestDetailsExpandable(detailsId) {
@@ -108,73 +64,55 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                 }
             }
             
-            // Dynamic tooltip positioning to prevent clipping
+            // Dynamic tooltip positioning to prevent clipping. One tooltip element is shared by all
+            // buttons and only shown and hidden on hover; it is created on first use
+            let buttonTooltip = null;
+            
+            function getButtonTooltip() {
+                if (buttonTooltip) return buttonTooltip;
+                
+                // Styled, arrow included, by the .dynamic-tooltip rules in the report styles
+                buttonTooltip = document.createElement('div');
+                buttonTooltip.className = 'dynamic-tooltip';
+                document.body.appendChild(buttonTooltip);
+                return buttonTooltip;
+            }
+            
             function setupTooltips() {
                 document.querySelectorAll('.root-cause-copy-btn[title], .root-cause-link-btn[title]').forEach(function(btn) {
-                    let tooltipEl = null;
-                    let arrowEl = null;
+                    // Set while this button's tooltip is shown
+                    let tooltipRect = null;
                     
                     btn.addEventListener('mouseenter', function(e) {
                         const tooltipText = this.getAttribute('title');
                         if (!tooltipText) return;
                         
-                        const rect = this.getBoundingClientRect();
-                        
-                        // Create tooltip element
-                        tooltipEl = document.createElement('div');
-                        tooltipEl.className = 'dynamic-tooltip';
-                        tooltipEl.textContent = tooltipText;
-                        tooltipEl.style.cssText = `
-                            position: fixed;
-                            top: ${rect.top - 35}px;
-                            left: ${rect.left + (rect.width / 2)}px;
-                            transform: translateX(-50%);
-                            padding: 6px 10px;
-                            background: #1f2933;
-                            color: #fff;
-                            font-size: 11px;
-                            white-space: nowrap;
-                            border-radius: 4px;
-                            pointer-events: none;
-                            z-index: 999999;
-                            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
-                        `;
-                        document.body.appendChild(tooltipEl);
-                        
-                        // Create arrow
-                        arrowEl = document.createElement('div');
-                        arrowEl.className = 'dynamic-tooltip-arrow';
-                        arrowEl.style.cssText = `
-                            position: fixed;
-                            top: ${rect.top - 7}px;
-                            left: ${rect.left + (rect.width / 2)}px;
-                            transform: translateX(-50%);
-                            border: 5px solid transparent;
-                            border-top-color: #1f2933;
-                            pointer-events: none;
-                            z-index: 999998;
-                        `;
-                        document.body.appendChild(arrowEl);
+                        const rect = tooltipRect = this.getBoundingClientRect();
+                        const tooltip = getButtonTooltip();
+                        tooltip.textContent = tooltipText;
+                        tooltip.style.top = (rect.top - 35) + 'px';
+                        tooltip.style.left = (rect.left + (rect.width / 2)) + 'px';
+                        tooltip.style.display = 'block';
                     });
                     
                     btn.addEventListener('mouseleave', function() {
-                        if (tooltipEl) {
-                            tooltipEl.remove();
-                            tooltipEl = null;
-                        }
-                        if (arrowEl) {
-                            arrowEl.remove();
-                            arrowEl = null;
+                        if (tooltipRect) {
+                            buttonTooltip.style.display = 'none';
+                            tooltipRect = null;
                         }
                     });
                     
                     btn.addEventListener('mousemove', function(e) {
-                        if (tooltipEl && arrowEl) {
+                        if (tooltipRect) {
+                            // Reading the rect is cheap while layout is clean. Restyling on every move would
+                            // dirty it, so the tooltip only moves when the button did (e.g. the page scrolled)
                             const rect = this.getBoundingClientRect();
-                            tooltipEl.style.top = (rect.top - 35) + 'px';
-                            tooltipEl.style.left = (rect.left + (rect.width / 2)) + 'px';
-                            arrowEl.style.top = (rect.top - 7) + 'px';
-                            arrowEl.style.left = (rect.left + (rect.width / 2)) + 'px';
+                            if (rect.top === tooltipRect.top && rect.left === tooltipRect.left && rect.width === tooltipRect.width) {
+                                return;
+                            }
+                            tooltipRect = rect;
+                            buttonTooltip.style.top = (rect.top - 35) + 'px';
+                            buttonTooltip.style.left = (rect.left + (rect.width / 2)) + 'px';
                         }
                     });
                 });
@@ -209,13 +147,16 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
             
             // Donut chart tooltip functions - create tooltip dynamically
             let donutTooltip = null;
+            // Its icon, label, count and percentage elements, kept from creation for every hover
+            let donutTooltipFields = null;
             
             function createDonutTooltip() {
                 if (donutTooltip) return donutTooltip;
                 
                 donutTooltip = document.createElement('div');
                 donutTooltip.id = 'donut-tooltip';
-                donutTooltip.style.cssText = 'position: fixed; display: none; background: #1f2933; color: #fff; padding: 10px 14px; border-radius: 6px; font-size: 12px; pointer-events: none; z-index: 1000000; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4); white-space: nowrap;';
+                // Styled by the #donut-tooltip rule; visibility stays inline, where the handlers check it
+                donutTooltip.style.display = 'none';
                 
                 const iconSpan = document.createElement('span');
                 iconSpan.id = 'donut-tooltip-icon';
@@ -240,6 +181,13 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                 donutTooltip.appendChild(countDiv);
                 donutTooltip.appendChild(percentageDiv);
                 
+                donutTooltipFields = {
+                    icon: iconSpan,
+                    label: labelSpan,
+                    count: countDiv.firstElementChild,
+                    percentage: percentageDiv.firstElementChild,
+                };
+                
                 document.body.appendChild(donutTooltip);
                 return donutTooltip;
             }
@@ -250,15 +198,10 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                 }
                 
                 // Update tooltip content
-                const iconEl = document.getElementById('donut-tooltip-icon');
-                const labelEl = document.getElementById('donut-tooltip-label');
-                const countEl = document.getElementById('donut-tooltip-count');
-                const percentageEl = document.getElementById('donut-tooltip-percentage');
-                
-                if (iconEl) iconEl.textContent = icon;
-                if (labelEl) labelEl.textContent = label;
-                if (countEl) countEl.textContent = count;
-                if (percentageEl) percentageEl.textContent = percentage.toFixed(1) + '%';
+                donutTooltipFields.icon.textContent = icon;
+                donutTooltipFields.label.textContent = label;
+                donutTooltipFields.count.textContent = count;
+                donutTooltipFields.percentage.textContent = percentage.toFixed(1) + '%';
                 
                 // Position tooltip near mouse cursor
                 const tooltipPadding = 15;
@@ -420,6 +363,18 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                 }
             }
             
+            // Error message row of the execution details table; only the message HTML varies
+            function buildErrorMessageRow(errorHtml) {
+                return '<tr>' +
+                    '<td style="padding: 4px; font-weight: 600; color: #6c757d; vertical-align: top; text-align: left;">Error Message:</td>' +
+                    '<td style="padding: 4px; text-align: left;">' +
+                    '<div style="background-color: #fff; padding: 5px 5px 5px 5px; border-radius: 3px; border-left: 2px solid #dc3545; font-family: monospace; font-size: 11px; max-height: 240px; overflow-y: auto; white-space: pre-wrap; word-wrap: break-word; text-align: left; margin: 0;">' +
+                    errorHtml +
+                    '</div>' +
+                    '</td>' +
+                    '</tr>';
+            }
+            
             function toggleExecutionDetails(dotId, testName, executionIndex) {
                 console.log('toggleExecutionDetails called:', dotId, testName, executionIndex);
                 // Get the dot element
@@ -511,25 +466,11 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                         // Re-escape for HTML display
                         cleanedError = decodedError.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;').replace(/'/g, '&#39;');
                         
-                        errorMessageRow = '<tr>' +
-                            '<td style="padding: 4px; font-weight: 600; color: #6c757d; vertical-align: top; text-align: left;">Error Message:</td>' +
-                            '<td style="padding: 4px; text-align: left;">' +
-                            '<div style="background-color: #fff; padding: 5px 5px 5px 5px; border-radius: 3px; border-left: 2px solid #dc3545; font-family: monospace; font-size: 11px; max-height: 240px; overflow-y: auto; white-space: pre-wrap; word-wrap: break-word; text-align: left; margin: 0;">' +
-                            cleanedError +
-                            '</div>' +
-                            '</td>' +
-                            '</tr>';
+                        errorMessageRow = buildErrorMessageRow(cleanedError);
                     } catch (e) {
                         console.error('Error processing error message:', e);
                         // Fallback: use original error message
-                        errorMessageRow = '<tr>' +
-                            '<td style="padding: 4px; font-weight: 600; color: #6c757d; vertical-align: top; text-align: left;">Error Message:</td>' +
-                            '<td style="padding: 4px; text-align: left;">' +
-                            '<div style="background-color: #fff; padding: 5px 5px 5px 5px; border-radius: 3px; border-left: 2px solid #dc3545; font-family: monospace; font-size: 11px; max-height: 240px; overflow-y: auto; white-space: pre-wrap; word-wrap: break-word; text-align: left; margin: 0;">' +
-                            (execError || 'Error message unavailable') +
-                            '</div>' +
-                            '</td>' +
-                            '</tr>';
+                        errorMessageRow = buildErrorMessageRow(execError || 'Error message unavailable');
                     }
                 }
                 
@@ -638,4 +579,28 @@ def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str)
                 });
             });
         """
-    )
+
+
+def get_html_scripts(dashboard_base_url: str, project_name: str, job_name: str) -> str:
+    """
+    Generate JavaScript code for the HTML report.
+    
+    Args:
+        dashboard_base_url: Base URL for the dashboard (e.g., "https://dashboard.qa.example.com")
+        project_name: Project name for building URLs
+        
+    Returns:
+        JavaScript code as a string
+    """
+    # Escape single quotes in the values to prevent JavaScript errors
+    dashboard_base_url_escaped = dashboard_base_url.replace("'", "\\'")
+    project_name_escaped = project_name.replace("'", "\\'")
+    job_name_escaped = (job_name or "").replace("'", "\\'")
+    
+    # Only the configuration lines vary; JavaScript braces stay out of the format string
+    return (
+        "            // Configuration from server\n"
+        f"            const DASHBOARD_BASE_URL = '{dashboard_base_url_escaped}';\n"
+        f"            const PROJECT_NAME = '{project_name_escaped}';\n"
+        f"            const JOB_NAME = '{job_name_escaped}';\n"
+    ) + _SCRIPTS_BODY
@@ -423,6 +423,43 @@ def get_html_styles(c_success: str, c_warning: str, c_danger: str, c_info: str,
                 .root-cause-link-btn[title]:hover::before {{
                     display: none !important;
                 }}
+                /* JavaScript tooltips; the scripts only set their text, position and visibility */
+                .dynamic-tooltip {{
+                    position: fixed;
+                    display: none;
+                    transform: translateX(-50%);
+                    padding: 6px 10px;
+                    background: #1f2933;
+                    color: #fff;
+                    font-size: 11px;
+                    white-space: nowrap;
+                    border-radius: 4px;
+                    pointer-events: none;
+                    z-index: 999999;
+                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
+                }}
+                #donut-tooltip {{
+                    position: fixed;
+                    background: #1f2933;
+                    color: #fff;
+                    padding: 10px 14px;
+                    border-radius: 6px;
+                    font-size: 12px;
+                    pointer-events: none;
+                    z-index: 1000000;
+                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.4);
+                    white-space: nowrap;
+                }}
+                /* Arrow of the JavaScript tooltip, drawn under its bottom edge */
+                .dynamic-tooltip::after {{
+                    content: '';
+                    position: absolute;
+                    top: 100%;
+                    left: 50%;
+                    transform: translateX(-50%);
+                    border: 5px solid transparent;
+                    border-top-color: #1f2933;
+                }}
                 .root-cause-chip-icon {{
                     font-size: 10px;
                     opacity: 0.6;
@@ -3,11 +3,12 @@ HTML Report Generator for test reports.
 Generates comprehensive HTML reports with test failures, AI analysis, and trends.
 """
 
+import io
 import os
 import logging
 import re
 import html as html_escape
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, List, Dict, Optional, TextIO, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -101,10 +102,39 @@ class ReportGenerator:
         Returns:
             HTML content as string
         """
-        html_content, test_api_map = self._generate_html(
-            summary, classifications, report_name, ai_summary, recurring_failures, trend, report_dir, test_results, test_html_links
+        buffer = io.StringIO()
+        test_api_map = self.write_html_report(
+            buffer, summary, classifications, report_name, ai_summary, recurring_failures, trend, report_dir, test_results, test_html_links
+        )
+        return buffer.getvalue(), test_api_map
+    
+    def write_html_report(
+        self,
+        fp: TextIO,
+        summary: TestSummary,
+        classifications: List[FailureClassification],
+        report_name: str,
+        ai_summary: str = "",
+        recurring_failures: Optional[List[Dict]] = None,
+        trend: Optional[str] = None,
+        report_dir: Optional[str] = None,
+        test_results: Optional[List[TestResult]] = None,
+        test_html_links: Optional[Dict[str, str]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Write HTML report content to a text file object fragment by fragment.
+        Avoids holding the complete report in memory as one string.
+        
+        Args:
+            fp: Writable text file object
+            (remaining arguments as for generate_html_report)
+            
+        Returns:
+            Dictionary mapping test_name to list of API endpoints
+        """
+        return self._generate_html(
+            fp.write, summary, classifications, report_name, ai_summary, recurring_failures, trend, report_dir, test_results, test_html_links
         )
-        return html_content, test_api_map
     
     def save_report(self, html_content: str, output_path: str) -> str:
         """
@@ -130,6 +160,32 @@ class ReportGenerator:
             logger.error(f"Failed to save report: {e}")
             raise
     
+    def save_html_report(self, output_path: str, **report_kwargs) -> Tuple[str, Dict[str, List[str]]]:
+        """
+        Generate the HTML report and stream it straight to a file.
+        
+        Args:
+            output_path: Path to save the report
+            **report_kwargs: Arguments accepted by write_html_report (summary, classifications, ...)
+            
+        Returns:
+            Tuple of (absolute path to saved file, test_api_map)
+        """
+        output_file = Path(output_path)
+        try:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(output_file, 'w', encoding='utf-8') as f:
+                test_api_map = self.write_html_report(f, **report_kwargs)
+            
+            logger.debug(f"✅ Report saved to {output_file.absolute()}")
+            return str(output_file.absolute()), test_api_map
+        except Exception as e:
+            logger.error(f"Failed to save report: {e}")
+            # Don't leave a truncated report behind
+            output_file.unlink(missing_ok=True)
+            raise
+    
     def _find_test_html_link(self, class_name: str, method_name: str, report_dir: Optional[str], report_name: str, test_html_links: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
         Find HTML link for a test in the report directory using actual method name.
@@ -246,7 +302,6 @@ class ReportGenerator:
             return None, None
         
         try:
-            from pathlib import Path
             from bs4 import BeautifulSoup
             
             overview_path = Path(report_dir) / 'html' / 'overview.html'
@@ -271,7 +326,6 @@ class ReportGenerator:
             
             # Parse pattern: "{group} cases on {branch} branch"
             # Example: "regression cases on develop branch"
-            import re
             pattern = r'(\w+)\s+cases\s+on\s+(\w+)\s+branch'
             match = re.search(pattern, header_text, re.IGNORECASE)
             
@@ -382,8 +436,6 @@ class ReportGenerator:
         if not execution_log:
             return None
         
-        import re
-        
         # Pattern: "Execution started for testcase - <description>"
         # May have timestamp prefix like "[21:33:48]"
         pattern = r'Execution started for testcase\s*-\s*(.+?)(?:\n|$)'
@@ -1914,6 +1966,7 @@ class ReportGenerator:
     
     def _generate_html(
         self,
+        write: Callable[[str], object],
         summary: TestSummary,
         classifications: List[FailureClassification],
         report_name: str,
@@ -1923,8 +1976,8 @@ class ReportGenerator:
         report_dir: Optional[str] = None,
         test_results: Optional[List[TestResult]] = None,
         test_html_links: Optional[Dict[str, str]] = None
-    ) -> str:
-        """Generate modern HTML report content"""
+    ) -> Dict[str, List[str]]:
+        """Generate modern HTML report content, passing each fragment to write() as it is built"""
         
         # Initialize TestDataCache for efficient data access
         # This eliminates redundant execution log fetching
@@ -2041,8 +2094,8 @@ class ReportGenerator:
         job_name_for_url = job_name_from_path  # None if not derivable
         js_scripts = get_html_scripts(Config.DASHBOARD_BASE_URL, project_name_for_js, job_name_for_url)
         
-        # Build HTML - use f-string for most content, but concatenate JavaScript separately
-        html = f"""<!DOCTYPE html>
+        # Stream HTML - use f-string for most content, but concatenate JavaScript separately
+        write(f"""<!DOCTYPE html>
         <html>
         <head>
             <meta charset="utf-8">
@@ -2085,17 +2138,16 @@ class ReportGenerator:
                 </div>
                 
                 <!-- Executive Summary -->
-        """
+        """)
         
         # Root Cause Category Summary
         # Group failures by category
         category_counts = {}
         category_failures = {}
         
-        for failure in deduplicated_classifications:
-            # Use rule engine to classify failure into category
-            category = rule_engine.classify(failure, test_data_cache)
-            
+        # Use rule engine to classify failures into categories
+        categories = rule_engine.classify_all(deduplicated_classifications, test_data_cache)
+        for failure, category in zip(deduplicated_classifications, categories):
             if category not in category_counts:
                 category_counts[category] = 0
                 category_failures[category] = []
@@ -2105,7 +2157,7 @@ class ReportGenerator:
         # Add Executive Summary section if available
         if ai_summary:
             # ai_summary is already HTML-formatted, so don't escape it
-            html += f"""
+            write(f"""
                 <div class="section">
                     <h2 class="section-title" style="border-color: #3498db">📊 Executive Summary</h2>
                     <p class="root-cause-subtitle">High-level overview of test execution results, failure patterns, and actionable insights derived from AI analysis of the test failures.</p>
@@ -2113,11 +2165,11 @@ class ReportGenerator:
                         {ai_summary}
                     </div>
                 </div>
-            """
+            """)
         
-        html += """
+        write("""
                 <!-- Root Cause Categories -->
-        """
+        """)
             
         # Only show if we have categories
         total_failures = 0
@@ -2190,12 +2242,12 @@ class ReportGenerator:
             }
             
             # Add anchor for navigation
-            html += f"""
+            write(f"""
                 <div class="section" id="root-cause-categories">
                     <h2 class="section-title" style="border-color: #6610f2">🧩 Failures by Root Cause Category</h2>
                     <p class="root-cause-subtitle">Breakdown of {sum(category_counts.values())} analyzed failures grouped by the AI-assigned root cause type. Click on any test to view details or expand "View details" for root cause and recommended actions.</p>
                     <div class="section-content root-cause-categories-container">
-            """
+            """)
             
             # Determine layout based on number of categories
             num_categories = len(sorted_categories)
@@ -2203,16 +2255,16 @@ class ReportGenerator:
             
             if use_two_row_layout:
                 # First row with 2 columns
-                html += '<div class="root-cause-grid-first-row">'
+                write('<div class="root-cause-grid-first-row">')
             else:
                 # Use original grid layout for 4 or fewer categories
-                html += '<div class="root-cause-grid">'
+                write('<div class="root-cause-grid">')
             
             for idx, category in enumerate(sorted_categories):
                 # Check if we need to switch to second row (after first 2 items)
                 if use_two_row_layout and idx == 2:
-                    html += '</div>'  # Close first row
-                    html += '<div class="root-cause-grid-second-row">'  # Open second row
+                    write('</div>')  # Close first row
+                    write('<div class="root-cause-grid-second-row">')  # Open second row
                 failures = category_failures.get(category, [])
                 # CRITICAL: Use actual count from failures list, not category_counts
                 # category_counts may be incorrect due to deduplication or other issues
@@ -2675,7 +2727,7 @@ class ReportGenerator:
                 
                 pill_html = f'<span class="root-cause-pill" style="background: {style["pill_bg"]}; color: {style["pill_color"]};">{style["tag"]}</span>'
                 
-                html += f"""
+                write(f"""
                         <div class="root-cause-card" style="--rc-color: {style['color']}; --rc-gradient: {style['gradient']};">
                             <div class="root-cause-card-content">
                                 <div class="root-cause-card-header">
@@ -2701,14 +2753,14 @@ class ReportGenerator:
                                 </div>
                             </div>
                         </div>
-                """
+                """)
             
-            html += f"""
+            write(f"""
                         </div>
                         <div class="root-cause-footnote">Percentages are calculated out of {total_failures} total failures.</div>
                     </div>
                 </div>
-            """
+            """)
         
         # Post-report validation: Validate data consistency after report generation
         post_validation_stats = validate_post_report(
@@ -2724,11 +2776,11 @@ class ReportGenerator:
         # Recurring Failures
         # Always show this section, even if empty
         flaky_count = len(recurring_failures) if recurring_failures else 0
-        html += f"""
+        write(f"""
             <div class="section" id="flaky-tests">
             <h2 class="section-title" style="border-color: #6c757d">⚠️ All Flaky Tests ({flaky_count} tests)</h2>
             <p class="root-cause-subtitle">Tests that atleast failed {Config.FLAKY_TESTS_MIN_FAILURES} times in the last {Config.FLAKY_TESTS_LAST_RUNS} executions. Click on execution history dots to view detailed failure information for each run.</p>
-        """
+        """)
         if recurring_failures:
             # Sort filtered data:
             # a) First by max number of failures (descending)
@@ -2763,7 +2815,7 @@ class ReportGenerator:
             
             sorted_recurring_failures = sorted(recurring_failures, key=sort_key)
             
-            html += f"""
+            write(f"""
                     <div class="section-content recurring-failures">
                     <table>
                         <thead>
@@ -2774,7 +2826,7 @@ class ReportGenerator:
                             </tr>
                         </thead>
                         <tbody>
-            """
+            """)
             for failure in sorted_recurring_failures:
                 full_name = failure['test_name']
                 
@@ -2896,7 +2948,7 @@ class ReportGenerator:
                 test_hash = abs(hash(test_name_escaped)) % 100000
                 details_row_id = f"details_{test_hash}"
                 
-                html += f"""
+                write(f"""
                             <tr>
                                 <td>
                                     <div class="test-name" title="{full_name_escaped}">{display_name_escaped}</div>
@@ -2925,15 +2977,15 @@ class ReportGenerator:
                                     </div>
                                 </td>
                             </tr>
-                """
-            html += """
+                """)
+            write("""
                         </tbody>
                     </table>
                 </div>
-            """
+            """)
         else:
             # Show message when no recurring failures found
-            html += f"""
+            write(f"""
                 <div class="section-content">
                     <p style="color: #6c757d; padding: 20px; text-align: center; font-style: italic;">
                         ✅ No flaky tests detected in the last {Config.FLAKY_TESTS_LAST_RUNS} runs.
@@ -2941,16 +2993,16 @@ class ReportGenerator:
                         <small style="color: #999;">This means tests are either passing consistently or failures are isolated incidents.</small>
                     </p>
                 </div>
-            """
-        html += """
+            """)
+        write("""
                 </div>
-            """
+            """)
 
         # Build the full logs URL
         # Build the full logs URL
         full_logs_url = ReportUrlBuilder.build_dashboard_url(Config.DASHBOARD_BASE_URL, report_name, "html/index.html", project_name_from_path, job_name_from_path)
         
-        html += f"""
+        write(f"""
                 <div class="footer">
                     Generated by <b>QA AI Agent</b> • <a href="{full_logs_url}" target="_blank" style="color: #3498db; text-decoration: none;">View Full Logs</a>
                 </div>
@@ -2960,7 +3012,7 @@ class ReportGenerator:
         </script>
         </body>
         </html>
-        """
+        """)
         
-        return html, test_api_map
+        return test_api_map
 
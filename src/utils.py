@@ -4,9 +4,16 @@ Consolidates duplicate code to reduce maintenance burden.
 """
 
 import re
-from typing import Optional, Tuple
+import sys
+import multiprocessing
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
+# Worker processes are spawned rather than forked: report parsing is started from a background
+# thread, and a forked child could inherit locks held by other threads
+SPAWN_CONTEXT = multiprocessing.get_context('spawn')
+
 
 class TestNameNormalizer:
     """
@@ -15,9 +22,12 @@ class TestNameNormalizer:
     """
     
     @staticmethod
+    @lru_cache(maxsize=8192)
     def normalize(name: str) -> str:
         """
         Normalize test name (remove duplicates, trim whitespace).
+        Results are memoized - the validators and the data cache normalize the same names repeatedly -
+        and interned, so different spellings of one test share a single key object in sets and dicts.
         
         Args:
             name: Test name string
@@ -28,7 +38,7 @@ class TestNameNormalizer:
         if not name:
             return ""
         cleaned = remove_duplicate_class_name(name)
-        return cleaned.strip()
+        return sys.intern(cleaned.strip())
     
     @staticmethod
     def match(name1: str, name2: str) -> bool:
@@ -56,6 +66,7 @@ class TestNameNormalizer:
         Returns:
             Matching TestResult object or None
         """
+        # The search name is normalized once, not once per result and strategy
         normalized_search = TestNameNormalizer.normalize(test_name)
         
         for result in test_results:
@@ -65,20 +76,39 @@ class TestNameNormalizer:
             result_method_name = getattr(result, 'method_name', '')
             
             # Strategy 1: Match normalized full_name
-            if TestNameNormalizer.match(test_name, result_full_name):
-                return result
-            
-            # Strategy 2: Match normalized test_name directly
             if TestNameNormalizer.normalize(result_full_name) == normalized_search:
                 return result
             
-            # Strategy 3: Match by class.method if available
+            # Strategy 2: Match by class.method if available
             if result_class_name and result_method_name:
                 class_method = f"{remove_duplicate_class_name(result_class_name)}.{result_method_name}"
-                if TestNameNormalizer.match(test_name, class_method):
+                if TestNameNormalizer.normalize(class_method) == normalized_search:
                     return result
         
         return None
+    
+    @staticmethod
+    def index_tests(test_results: list) -> Dict[str, object]:
+        """
+        Index test results by every normalized name find_matching_test accepts for them.
+        index.get(TestNameNormalizer.normalize(name)) returns the same result as
+        find_matching_test(name, test_results), with one lookup instead of a scan.
+        
+        Args:
+            test_results: List of TestResult objects
+            
+        Returns:
+            Dictionary mapping normalized test name to the first matching TestResult
+        """
+        index = {}
+        for result in test_results:
+            index.setdefault(TestNameNormalizer.normalize(getattr(result, 'full_name', '')), result)
+            result_class_name = getattr(result, 'class_name', '')
+            result_method_name = getattr(result, 'method_name', '')
+            if result_class_name and result_method_name:
+                class_method = f"{remove_duplicate_class_name(result_class_name)}.{result_method_name}"
+                index.setdefault(TestNameNormalizer.normalize(class_method), result)
+        return index
 
 
 class ReportUrlBuilder:
@@ -192,6 +222,7 @@ class ReportUrlBuilder:
         return f"{base_url}/Results/{project_name}/{report_name}/{html_path}"
 
 
+@lru_cache(maxsize=4096)
 def remove_duplicate_class_name(class_name: str) -> str:
     """
     Remove duplicate class name segments from a class name string.
@@ -205,6 +236,8 @@ def remove_duplicate_class_name(class_name: str) -> str:
     - "TestDashBusinessesApis.TestDashBusinessesApis"
       -> "TestDashBusinessesApis"
     
+    Results are memoized - the same class name repeats for every method of a class.
+    
     Args:
         class_name: Class name string that may contain duplicates
         
@@ -495,6 +528,26 @@ class TestDataCache:
             return cached.get('combined_log', '')
         return ''
     
+    def get_combined_log_lower(self, test_name: str) -> str:
+        """
+        Get the lowercased combined log. It is computed on first use and kept with the test's
+        cached data, so case-insensitive checks don't re-lowercase multi-KB logs on every call.
+        
+        Args:
+            test_name: Test name
+            
+        Returns:
+            Lowercased combined log string (empty string if not found)
+        """
+        normalized = TestNameNormalizer.normalize(test_name)
+        cached = self._cache.get(normalized)
+        if not cached:
+            return ''
+        combined_log_lower = cached.get('combined_log_lower')
+        if combined_log_lower is None:
+            combined_log_lower = cached['combined_log_lower'] = cached.get('combined_log', '').lower()
+        return combined_log_lower
+    
     def get_html_link(self, test_name: str) -> Optional[str]:
         """
         Get HTML link for a test.
@@ -511,6 +564,44 @@ class TestDataCache:
             return cached.get('html_link')
         return None
     
+    def get_combined_logs_bulk(self, test_names) -> Dict[str, str]:
+        """
+        Get combined logs for many tests in one call.
+        
+        Args:
+            test_names: Iterable of test names
+            
+        Returns:
+            Dictionary mapping each test name to its combined log (empty string if not found)
+        """
+        cache = self._cache
+        normalize = TestNameNormalizer.normalize
+        logs = {}
+        for test_name in test_names:
+            if test_name not in logs:
+                cached = cache.get(normalize(test_name))
+                logs[test_name] = cached.get('combined_log', '') if cached else ''
+        return logs
+    
+    def get_html_links_bulk(self, test_names) -> Dict[str, Optional[str]]:
+        """
+        Get HTML links for many tests in one call.
+        
+        Args:
+            test_names: Iterable of test names
+            
+        Returns:
+            Dictionary mapping each test name to its HTML link URL or None
+        """
+        cache = self._cache
+        normalize = TestNameNormalizer.normalize
+        links = {}
+        for test_name in test_names:
+            if test_name not in links:
+                cached = cache.get(normalize(test_name))
+                links[test_name] = cached.get('html_link') if cached else None
+        return links
+    
     def get_test_result(self, test_name: str):
         """
         Get TestResult object for a test.
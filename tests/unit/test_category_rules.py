@@ -0,0 +1,157 @@
+"""
+Unit tests for the category classification rule engine.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.agent.analyzer import FailureClassification
+from src.parsers.models import TestResult, TestStatus
+from src.reporters import category_rules
+from src.reporters.category_rules import (
+    RE2_AVAILABLE, CategoryRuleEngine, PageLoadTimeoutRule, _exception_names, clear_classify_cache
+)
+from src.utils import TestDataCache
+
+
+def _classify(root_cause: str, category: str = 'OTHER', execution_log: str = '') -> str:
+    """Classify a single failure of pkg.web.TestA.testOne with the given root cause and log"""
+    result = TestResult(
+        class_name='pkg.web.TestA',
+        method_name='testOne',
+        status=TestStatus.FAIL,
+        duration_seconds=1.0,
+        execution_log=execution_log
+    )
+    failure = FailureClassification(
+        'pkg.web.TestA.testOne', 'AUTOMATION_ISSUE', 'HIGH', root_cause, '', category
+    )
+    return CategoryRuleEngine().classify(failure, TestDataCache([result], {}))
+
+
+def test_timeout_patterns_are_classified_as_timeout():
+    """Page load, element visibility and element TimeoutException messages all map to TIMEOUT"""
+    assert _classify("'DashReviewPage' NOT loaded even after :- 40.071 seconds") == 'TIMEOUT'
+    assert _classify("Element 'Page:btn' is not visible and clickable even after waiting for 30 seconds") == 'TIMEOUT'
+    assert _classify("", execution_log=(
+        "org.openqa.selenium.TimeoutException: Expected condition failed: "
+        "waiting for element to be clickable"
+    )) == 'TIMEOUT'
+
+
+def test_filter_rules_move_unsupported_categories_to_other():
+    """TIMEOUT/ASSERTION_FAILURE without a matching pattern fall back to OTHER"""
+    assert _classify("Connection reset", category='TIMEOUT') == 'OTHER'
+    assert _classify("Expected 'a' was :- 'b'. But actual is 'c'", category='ASSERTION_FAILURE') == 'ASSERTION_FAILURE'
+    assert _classify("NoSuchElementException: #login", category='ASSERTION_FAILURE') == 'OTHER'
+    assert _classify("boom", category='NETWORK_ISSUE') == 'ENVIRONMENT_ISSUE'
+
+
+def test_element_exceptions_are_classified_as_element_not_found():
+    """Element locator exceptions in the root cause or the log map to ELEMENT_NOT_FOUND"""
+    assert _classify("ElementClickInterceptedException at x") == 'ELEMENT_NOT_FOUND'
+    assert _classify("", execution_log="java.lang.NullPointerException: WebElement was null") == 'ELEMENT_NOT_FOUND'
+    assert _classify("java.lang.IllegalArgumentException: bad") == 'ELEMENT_NOT_FOUND'
+
+
+def test_exception_names_match_as_substrings():
+    """Exception names are found anywhere in the text, including inside longer exception names"""
+    text = "timeoutexception at start; java.lang.arrayindexoutofboundsexception: index 0; exceptionexception"
+    assert _exception_names(text) == {'timeoutexception', 'indexoutofboundsexception'}
+    assert _exception_names("no exceptions here") == frozenset()
+
+
+def test_long_quoted_runs_do_not_backtrack():
+    """A quoted run with many 'page' words is matched in linear time (this took minutes before)"""
+    quoted = "'" + "xpage " * 20000 + "'"
+    assert _classify("", execution_log=f"{quoted} loaded") == 'OTHER'
+    assert _classify("", execution_log=f"{quoted} NOT loaded even after :- 40 seconds") == 'TIMEOUT'
+    # Repeated TimeoutException / "expected" words on one line are scanned once, not once per occurrence
+    assert _classify("", category='TIMEOUT', execution_log="TimeoutException " * 20000) == 'OTHER'
+    assert _classify("", category='ASSERTION_FAILURE', execution_log="expected 'a' but " * 20000 + "but actual") == 'ASSERTION_FAILURE'
+
+
+@pytest.mark.skipif(not RE2_AVAILABLE, reason="google-re2 is not installed")
+def test_repeated_expected_runs_do_not_backtrack_with_re2():
+    """With RE2 the "Expected 'X' was :-'Y'" pattern stays linear on quote-free repeats of the word"""
+    assert _classify("", category='ASSERTION_FAILURE', execution_log="expected " * 20000 + "actual") == 'ASSERTION_FAILURE'
+
+
+def test_classify_all_matches_classify_in_order():
+    """classify_all returns the same categories as classify, in input order"""
+    logs = ["'DashPage' NOT loaded even after :- 4 seconds", "java.lang.NullPointerException: WebElement was null", "boom"]
+    results = [
+        TestResult(class_name=f'pkg.web.Test{i}', method_name='testOne', status=TestStatus.FAIL,
+                   duration_seconds=1.0, execution_log=log)
+        for i, log in enumerate(logs)
+    ]
+    failures = [
+        FailureClassification(r.full_name, 'AUTOMATION_ISSUE', 'HIGH', '', '', 'ASSERTION_FAILURE')
+        for r in results
+    ]
+    cache = TestDataCache(results, {})
+    engine = CategoryRuleEngine()
+
+    categories = engine.classify_all(failures, cache)
+    assert categories == [engine.classify(f, cache) for f in failures]
+    assert categories == ['TIMEOUT', 'ELEMENT_NOT_FOUND', 'OTHER']
+
+
+def test_classify_all_worker_pool_uses_engine_rules():
+    """classify_all with explicit workers runs the pool with the engine's own rules"""
+    logs = ["'DashPage' NOT loaded even after :- 4 seconds", "java.lang.NullPointerException: WebElement was null",
+            "boom", "'DashPage' NOT loaded even after :- 4 seconds"]
+    results = [
+        TestResult(class_name=f'pkg.web.PoolTest{i}', method_name='testOne', status=TestStatus.FAIL,
+                   duration_seconds=1.0, execution_log=log)
+        for i, log in enumerate(logs)
+    ]
+    failures = [
+        FailureClassification(r.full_name, 'AUTOMATION_ISSUE', 'HIGH', 'pool', '', 'ASSERTION_FAILURE')
+        for r in results
+    ]
+    cache = TestDataCache(results, {})
+    engine = CategoryRuleEngine([PageLoadTimeoutRule()])
+
+    categories = engine.classify_all(failures, cache, workers=2)
+    assert categories == ['TIMEOUT', 'ASSERTION_FAILURE', 'ASSERTION_FAILURE', 'TIMEOUT']
+    assert categories == [engine.classify(f, cache) for f in failures]
+
+
+def test_classify_all_keeps_memo_hits_evicted_by_new_entries(monkeypatch):
+    """A memo hit evicted while classify_all stores the new categories is still returned"""
+    clear_classify_cache()
+    monkeypatch.setattr(category_rules, '_CLASSIFY_CACHE_MAX_ENTRIES', 1)
+    logs = ["'DashPage' NOT loaded even after :- 4 seconds", "boom"]
+    results = [
+        TestResult(class_name=f'pkg.web.EvictTest{i}', method_name='testOne', status=TestStatus.FAIL,
+                   duration_seconds=1.0, execution_log=log)
+        for i, log in enumerate(logs)
+    ]
+    failures = [
+        FailureClassification(r.full_name, 'AUTOMATION_ISSUE', 'HIGH', 'evict', '', 'ASSERTION_FAILURE')
+        for r in results
+    ]
+    cache = TestDataCache(results, {})
+    engine = CategoryRuleEngine([PageLoadTimeoutRule()])
+    engine.classify(failures[0], cache)
+
+    assert engine.classify_all(failures, cache, workers=2) == ['TIMEOUT', 'ASSERTION_FAILURE']
+
+
+def test_classify_memo_does_not_hold_logs():
+    """The classify() memo is keyed on a digest of the log, and clear_classify_cache empties it"""
+    clear_classify_cache()
+    execution_log = "'DashPage' NOT loaded even after :- 4 seconds " + "x" * 10000
+    assert _classify('', execution_log=execution_log) == 'TIMEOUT'
+    assert len(category_rules._CLASSIFY_CACHE) == 1
+    (key,) = category_rules._CLASSIFY_CACHE
+    assert execution_log not in key and len(key[-1]) == 16
+
+    clear_classify_cache()
+    assert not category_rules._CLASSIFY_CACHE
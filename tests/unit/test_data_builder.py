@@ -0,0 +1,95 @@
+"""
+Unit tests for the database-to-TestResult conversion in data_builder.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.parsers.data_builder import (
+    _find_matching_html_data,
+    _index_by_method_name,
+    _is_metadata_line,
+    db_row_to_test_result,
+    get_full_report_data_from_db
+)
+from src.parsers.models import TestStatus
+
+
+def test_metadata_lines_are_detected():
+    """Pipeline metadata lines are recognised regardless of case and spacing"""
+    assert _is_metadata_line("Results Url: http://example.com")
+    assert _is_metadata_line("  results   url :x")
+    assert _is_metadata_line("\tTESTCASE NAME:foo")
+    assert _is_metadata_line("TestcaseName:foo")
+    assert not _is_metadata_line("Results Urls: x")
+    assert not _is_metadata_line("java.lang.AssertionError: Results Url: x")
+    assert not _is_metadata_line("")
+
+
+def test_db_row_strips_metadata_and_extracts_error_type():
+    """failureReason metadata is removed and the error type comes from the first line"""
+    db_row = {
+        'testcaseName': 'Automation.api.TestLogin.testInvalidCredentials',
+        'testStatus': 'failed',
+        'failureReason': "Results Url: http://x\nTestcase Name: y\njava.lang.AssertionError: boom",
+    }
+    result = db_row_to_test_result(db_row, duration=1.5)
+
+    assert result.class_name == 'Automation.api.TestLogin'
+    assert result.method_name == 'testInvalidCredentials'
+    assert result.status == TestStatus.FAIL
+    assert result.error_message == 'java.lang.AssertionError: boom'
+    assert result.error_type == 'AssertionError'
+    assert result.platform == 'API'
+    assert result.duration_seconds == 1.5
+
+
+def test_html_data_falls_back_to_method_name_match():
+    """Unmatched class names fall back to the first log/duration with the same method name"""
+    execution_logs = {
+        'pkg.TestA.testLogin': 'log A',
+        'pkg.TestB.testLogin': 'log B',
+        'TestC.testLogout': 'log C',
+    }
+    durations = {'pkg.TestB.testLogin': 2.0, 'TestC.testLogout': 3.0}
+    logs_by_method = _index_by_method_name(execution_logs)
+    durations_by_method = _index_by_method_name(durations)
+
+    assert _find_matching_html_data(
+        'other.TestZ.TESTLOGIN', execution_logs, durations, logs_by_method, durations_by_method
+    ) == ('log A', 2.0)
+    assert _find_matching_html_data('pkg.TestC.testLogout', execution_logs, durations) == ('log C', 3.0)
+    assert _find_matching_html_data('TestC.testMissing', execution_logs, {}, logs_by_method) == (None, None)
+
+
+def test_full_report_data_deduplicates_and_supports_dict_access():
+    """Duplicate rows collapse to the failing one and the bundle still supports data['key']"""
+    db_results = [
+        {'testcaseName': 'pkg.TestA.testOne', 'testStatus': 'PASSED', 'failureReason': ''},
+        {'testcaseName': 'pkg.TestA.testOne', 'testStatus': 'FAILED', 'failureReason': 'java.lang.AssertionError: x'},
+        {'testcaseName': 'pkg.TestA.testTwo', 'testStatus': 'PASSED', 'failureReason': ''},
+    ]
+    links = {'pkg.TestA.testOne': 'html/suite1_test1_results.html'}
+    data = get_full_report_data_from_db('/tmp/report', db_results, {}, {}, links)
+
+    assert [r.method_name for r in data.test_results] == ['testOne', 'testTwo']
+    assert data.test_results[0].status == TestStatus.FAIL
+    assert data['summary'].failed == 1
+    assert data.get('html_links') == links
+    assert data.get('missing', 'default') == 'default'
+
+
+def test_full_report_data_falls_back_when_winning_row_cannot_convert():
+    """A duplicate whose best-scored row is malformed is still reported from its next-best row"""
+    db_results = [
+        {'testcaseName': 'pkg.TestA.testOne', 'testStatus': 'PASS', 'failureReason': ''},
+        {'testcaseName': 'pkg.TestA.testOne', 'testStatus': 'FAIL', 'failureReason': 42},
+        {'testcaseName': 'pkg.TestA.testTwo', 'testStatus': None},
+    ]
+    data = get_full_report_data_from_db('/tmp/report', db_results, {}, {}, {'pkg.TestA.testOne': 'x'})
+
+    assert [r.method_name for r in data.test_results] == ['testOne']
+    assert data.test_results[0].status == TestStatus.PASS
@@ -0,0 +1,32 @@
+"""
+Unit tests for the report data validators.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.agent.analyzer import FailureClassification
+from src.parsers.models import TestResult, TestStatus
+from src.reporters.data_validator import DataValidator
+from src.utils import TestDataCache
+
+
+def test_duplicate_classifications_report_their_full_count():
+    """Each duplicated test is reported once, with the number of times it was classified"""
+    results = [
+        TestResult(class_name=f'pkg.web.Test{name}', method_name='testOne', status=TestStatus.FAIL,
+                   duration_seconds=1.0, execution_log='boom')
+        for name in 'AB'
+    ]
+    classifications = [
+        FailureClassification(name, 'AUTOMATION_ISSUE', 'HIGH', '', '', 'OTHER')
+        for name in ['pkg.web.TestA.testOne'] * 3 + ['pkg.web.TestB.testOne']
+    ]
+    stats = DataValidator(results, classifications, TestDataCache(results, {})).validate_all()
+
+    assert stats['duplicate_tests'] == 1
+    assert "Duplicate classification: pkg.web.TestA.testOne (seen 3 times)" in stats['warnings']
+    assert stats['classification_mismatches'] == 0
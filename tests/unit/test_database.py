@@ -0,0 +1,21 @@
+"""
+Unit tests for database helpers that do not need a connection.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.database import Database
+
+
+def test_table_name_from_report_name():
+    """Report names map to their results table, with Regression-<Project>- checked before ProdSanity-"""
+    assert Database.get_table_name_from_report_name("Regression-AccountOpening-Tests-420") == "results_accountopening"
+    assert Database.get_table_name_from_report_name("ProdSanity-All-Tests-524") == "results_prodsanity"
+    assert Database.get_table_name_from_report_name("Regression-Payments") == "results_payments"
+    assert Database.get_table_name_from_report_name("ProdSanity-Regression-Cards-1") == "results_cards"
+    assert Database.get_table_name_from_report_name("Regression-Cards ProdSanity-1") == "results_prodsanity"
+    assert Database.get_table_name_from_report_name("Nightly-Build-7") is None
@@ -0,0 +1,48 @@
+"""
+Unit tests for streaming test results out of results HTML files.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.parsers import html_parser
+from src.parsers.html_parser import HTMLReportParser
+from src.parsers.models import TestStatus
+
+
+def test_passed_results_stream_before_eof_without_failed_table(tmp_path, monkeypatch):
+    """A suite with no Failed Tests table yields its passed results while the file is still being read"""
+    rows = ''.join(
+        f'<tr><td class="method">testPass{i}</td><td class="duration">1.00s</td><td class="result"></td></tr>'
+        for i in range(3)
+    )
+    results_file = tmp_path / 'suite1_test1_results.html'
+    results_file.write_text(
+        '<html><body><table class="resultsTable">'
+        '<tr><th colspan="4" class="header passed">Passed Tests</th></tr>'
+        '<tr><td colspan="3" class="group">pkg.web.TestA</td></tr>' + rows + '</table>'
+        # Several read chunks of trailing markup, so the end of the file is well past the table
+        + '<p>padding</p>' * 20000 + '</body></html>',
+        encoding='utf-8'
+    )
+
+    read_to_end = []
+    iter_results_events = html_parser._iter_results_events
+
+    def tracking_events(path):
+        yield from iter_results_events(path)
+        read_to_end.append(True)
+
+    monkeypatch.setattr(html_parser, '_iter_results_events', tracking_events)
+
+    results = HTMLReportParser().iter_test_results(str(results_file))
+    first = next(results)
+
+    assert not read_to_end
+    assert first.full_name == 'pkg.web.TestA.testPass0'
+    assert first.status == TestStatus.PASS
+    assert [result.method_name for result in results] == ['testPass1', 'testPass2']
+    assert read_to_end